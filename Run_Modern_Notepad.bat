@@ -1,3 +1,3 @@
 @echo off 
 cd /d "D:\codelabpraveen\coding\programming\python\prj\tkinter_gui\Notepad\" 
-start "" "dist\Modern_Notepad.exe" 
+start "" "dist\Modern_Notepad\Modern_Notepad.exe" 
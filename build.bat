@@ -154,7 +154,7 @@ echo       Building Modern Notepad
 echo ============================================
 echo.
 echo This process will:
-echo • Create a standalone executable (.exe)
+echo • Create a standalone application folder
 echo • Include all dependencies
 echo • Bundle assets and modules
 echo • Optimize for performance
@@ -174,7 +174,7 @@ if errorlevel 1 (
     REM Alternative build using direct PyInstaller command
     if exist "assets\icons\notepad.ico" (
         echo Building with custom icon...
-        pyinstaller --onefile ^
+        pyinstaller --onedir ^
                     --windowed ^
                     --name=Modern_Notepad ^
                     --icon=assets/icons/notepad.ico ^
@@ -186,23 +186,20 @@ if errorlevel 1 (
                     --noupx ^
                     --hidden-import=tkinter ^
                     --hidden-import=tkinter.ttk ^
-                    --hidden-import=tkinter.messagebox ^
-                    --hidden-import=tkinter.filedialog ^
-                    --hidden-import=tkinter.scrolledtext ^
-                    --hidden-import=pyspellchecker ^
-                    --hidden-import=features ^
-                    --hidden-import=themes ^
-                    --hidden-import=ui ^
-                    --hidden-import=utils ^
+                    --hidden-import=spellchecker ^
+                    --exclude-module=unittest ^
+                    --exclude-module=doctest ^
+                    --exclude-module=pydoc ^
+                    --exclude-module=test ^
+                    --exclude-module=xml ^
+                    --exclude-module=email ^
+                    --exclude-module=http ^
                     --add-data=assets;assets ^
-                    --add-data=features;features ^
                     --add-data=themes;themes ^
-                    --add-data=ui;ui ^
-                    --add-data=utils;utils ^
                     main.py
     ) else (
         echo Building without custom icon...
-        pyinstaller --onefile ^
+        pyinstaller --onedir ^
                     --windowed ^
                     --name=Modern_Notepad ^
                     --distpath=dist ^
@@ -213,19 +210,16 @@ if errorlevel 1 (
                     --noupx ^
                     --hidden-import=tkinter ^
                     --hidden-import=tkinter.ttk ^
-                    --hidden-import=tkinter.messagebox ^
-                    --hidden-import=tkinter.filedialog ^
-                    --hidden-import=tkinter.scrolledtext ^
-                    --hidden-import=pyspellchecker ^
-                    --hidden-import=features ^
-                    --hidden-import=themes ^
-                    --hidden-import=ui ^
-                    --hidden-import=utils ^
+                    --hidden-import=spellchecker ^
+                    --exclude-module=unittest ^
+                    --exclude-module=doctest ^
+                    --exclude-module=pydoc ^
+                    --exclude-module=test ^
+                    --exclude-module=xml ^
+                    --exclude-module=email ^
+                    --exclude-module=http ^
                     --add-data=assets;assets ^
-                    --add-data=features;features ^
                     --add-data=themes;themes ^
-                    --add-data=ui;ui ^
-                    --add-data=utils;utils ^
                     main.py
     )
 
@@ -250,7 +244,7 @@ echo ============================================
 echo.
 
 REM Check if executable was created
-if not exist "dist\Modern_Notepad.exe" (
+if not exist "dist\Modern_Notepad\Modern_Notepad.exe" (
     echo Error: Executable was not created!
     echo Please check the build logs above for errors.
     echo.
@@ -259,18 +253,18 @@ if not exist "dist\Modern_Notepad.exe" (
 )
 
 REM Get file size
-for %%A in ("dist\Modern_Notepad.exe") do set SIZE=%%~zA
+for %%A in ("dist\Modern_Notepad\Modern_Notepad.exe") do set SIZE=%%~zA
 set /a SIZE_MB=%SIZE%/1024/1024
 
 echo Build Summary:
-echo • Executable: dist\Modern_Notepad.exe
+echo • Executable: dist\Modern_Notepad\Modern_Notepad.exe
 echo • File size: %SIZE_MB% MB
 echo • Build date: %date% %time%
 echo.
 
 echo Distribution files created:
-if exist "dist\README_DIST.txt" echo • README_DIST.txt - User documentation
-if exist "dist\LICENSE.txt" echo • LICENSE.txt - License information
+if exist "dist\Modern_Notepad\README_DIST.txt" echo • README_DIST.txt - User documentation
+if exist "dist\Modern_Notepad\LICENSE.txt" echo • LICENSE.txt - License information
 echo.
 
 REM Ask if user wants to test the executable
@@ -280,7 +274,7 @@ if /i "%test%"=="y" (
     echo The application should start in a few seconds...
     echo Close it when you're satisfied with the test.
     echo.
-    start "" "dist\Modern_Notepad.exe"
+    start "" "dist\Modern_Notepad\Modern_Notepad.exe"
 
     REM Wait a moment then check if it's running
     timeout /t 3 /nobreak >nul
@@ -315,7 +309,7 @@ echo ============================================
 echo.
 echo Your Modern Notepad is ready!
 echo.
-echo 📁 Location: %cd%\dist\Modern_Notepad.exe
+echo 📁 Location: %cd%\dist\Modern_Notepad\Modern_Notepad.exe
 echo 💾 Size: %SIZE_MB% MB
 echo 🎯 Status: Ready for distribution
 echo.
@@ -342,7 +336,7 @@ echo.
 REM Create a simple batch file to run the application
 echo @echo off > "Run_Modern_Notepad.bat"
 echo cd /d "%~dp0" >> "Run_Modern_Notepad.bat"
-echo start "" "dist\Modern_Notepad.exe" >> "Run_Modern_Notepad.bat"
+echo start "" "dist\Modern_Notepad\Modern_Notepad.exe" >> "Run_Modern_Notepad.bat"
 
 echo Created Run_Modern_Notepad.bat for easy launching.
 echo.
@@ -50,7 +50,7 @@ class AutoSave:
     def _setup_events(self):
         """Setup event bindings"""
         # Text change events
-        self.text_widget.bind('<<Modified>>', self._on_text_modified)
+        self.text_widget.bind('<<Modified>>', self._on_text_modified, add='+')
 
         # Focus events
         self.editor.window.bind('<FocusOut>', self._on_focus_lost)
@@ -58,9 +58,11 @@ class FileOperations:
         # Clear the text widget
         self.editor.text_widget.delete('1.0', 'end')
 
-        # Reset file state
+        # Reset file state; clear Tk's flag too so the queued <<Modified>> is not taken as an edit
         self.editor.current_file = None
+        self.editor.text_widget.edit_modified(False)
         self.editor.set_modified(False)
+        self.editor.refresh_document_state()
         self.editor.window.title("Modern Notepad - Untitled")
 
         # Clear undo history
@@ -70,8 +72,8 @@ class FileOperations:
         self.editor.app.logger.log_user_action("New file created")
         return True
 
-    def open_file(self, file_path=None):
-        """Open a file"""
+    def open_file(self, file_path=None, preloaded=None):
+        """Open a file, optionally using content that was already read from disk"""
         if file_path is None:
             file_path = filedialog.askopenfilename(
                 title="Open File",
@@ -108,20 +110,17 @@ class FileOperations:
                     return False
 
         try:
-            # Detect encoding
-            encoding = self._detect_encoding(file_path)
-
-            # Read file content
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
+            content = preloaded if preloaded is not None else self.read_file(file_path)
 
             # Set content in text widget
             self.editor.text_widget.delete('1.0', 'end')
             self.editor.text_widget.insert('1.0', content)
 
-            # Update editor state
+            # Update editor state; clear Tk's flag too so the queued <<Modified>> is not taken as an edit
             self.editor.current_file = file_path
+            self.editor.text_widget.edit_modified(False)
             self.editor.set_modified(False)
+            self.editor.refresh_document_state()
             self.editor.window.title(f"Modern Notepad - {os.path.basename(file_path)}")
 
             # Clear undo history
@@ -149,6 +148,12 @@ class FileOperations:
             self.editor.app.logger.log_error_with_context(str(e), f"Opening file: {file_path}")
             return False
 
+    def read_file(self, file_path):
+        """Read a file using its detected encoding; safe to call off the Tk thread"""
+        encoding = self._detect_encoding(file_path)
+        with open(file_path, 'r', encoding=encoding) as f:
+            return f.read()
+
     def save_file(self):
         """Save the current file"""
         if self.editor.current_file is None:
@@ -186,43 +191,47 @@ class FileOperations:
 
         return False
 
+    def write_to_disk(self, file_path, content):
+        """Write content to file_path atomically; safe to call off the Tk thread"""
+        # Create backup if enabled
+        if self.editor.config.get('backup_files', True) and os.path.exists(file_path):
+            self._create_backup(file_path)
+
+        # Determine encoding
+        encoding = self.editor.config.get('encoding', 'utf-8')
+
+        # Write to temporary file first, then move (atomic save)
+        temp_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                    mode='w',
+                    encoding=encoding,
+                    delete=False,
+                    dir=os.path.dirname(file_path),
+                    prefix=f".{os.path.basename(file_path)}.tmp"
+            ) as f:
+                f.write(content)
+                temp_file = f.name
+
+            # Move temporary file to target
+            shutil.move(temp_file, file_path)
+
+        except Exception as e:
+            # Clean up temporary file if something went wrong
+            if temp_file and os.path.exists(temp_file):
+                try:
+                    os.unlink(temp_file)
+                except:
+                    pass
+            raise e
+
     def _save_to_file(self, file_path):
         """Save content to specified file"""
         try:
-            # Create backup if enabled
-            if self.editor.config.get('backup_files', True) and os.path.exists(file_path):
-                self._create_backup(file_path)
-
             # Get content from text widget
             content = self.editor.text_widget.get('1.0', 'end-1c')
 
-            # Determine encoding
-            encoding = self.editor.config.get('encoding', 'utf-8')
-
-            # Write to temporary file first, then move (atomic save)
-            temp_file = None
-            try:
-                with tempfile.NamedTemporaryFile(
-                        mode='w',
-                        encoding=encoding,
-                        delete=False,
-                        dir=os.path.dirname(file_path),
-                        prefix=f".{os.path.basename(file_path)}.tmp"
-                ) as f:
-                    f.write(content)
-                    temp_file = f.name
-
-                # Move temporary file to target
-                shutil.move(temp_file, file_path)
-
-            except Exception as e:
-                # Clean up temporary file if something went wrong
-                if temp_file and os.path.exists(temp_file):
-                    try:
-                        os.unlink(temp_file)
-                    except:
-                        pass
-                raise e
+            self.write_to_disk(file_path, content)
 
             # Update editor state
             self.editor.set_modified(False)
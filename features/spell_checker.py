@@ -52,7 +52,7 @@ class SpellChecker:
 
         # Bind events for real-time spell checking
         if self.enabled:
-            self.text_widget.bind('<KeyRelease>', self._on_text_change)
+            self.text_widget.bind('<KeyRelease>', self._on_text_change, add='+')
             self.text_widget.bind('<Button-3>', self._on_right_click)
 
     def _setup_tags(self):
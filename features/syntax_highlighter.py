@@ -17,6 +17,7 @@ class SyntaxHighlighter:
         self.is_highlighting = False
         self.highlight_thread = None
         self.stop_highlighting = False
+        self._line_offset = 0
 
         # Language definitions
         self.languages = {
@@ -152,10 +153,6 @@ class SyntaxHighlighter:
         # Initialize highlighting tags
         self._setup_tags()
 
-        # Bind events for real-time highlighting
-        self.text_widget.bind('<KeyRelease>', self._on_text_change)
-        self.text_widget.bind('<<Modified>>', self._on_modified)
-
     def _setup_tags(self):
         """Setup text widget tags for syntax highlighting"""
         # Get theme colors (default to light theme if not available)
@@ -218,14 +215,19 @@ class SyntaxHighlighter:
         # Default to text if no match
         self.file_type = 'text'
 
-    def highlight(self, force=False):
-        """Highlight the entire document"""
+    def highlight(self, start='1.0', end='end-1c', force=False):
+        """Highlight the lines between start and end (the entire document by default)"""
         if not self.file_type or self.file_type == 'text':
             return
 
         if self.is_highlighting and not force:
             return
 
+        # Snapshot the range on the Tk thread, widened to whole lines
+        start = self.text_widget.index(f'{start} linestart')
+        end = self.text_widget.index(f'{end} lineend')
+        content = self.text_widget.get(start, end)
+
         # Stop any existing highlighting thread
         self.stop_highlighting = True
         if self.highlight_thread and self.highlight_thread.is_alive():
@@ -233,23 +235,25 @@ class SyntaxHighlighter:
 
         # Start new highlighting thread
         self.stop_highlighting = False
-        self.highlight_thread = threading.Thread(target=self._highlight_worker)
+        self.highlight_thread = threading.Thread(
+            target=self._highlight_worker, args=(content, start, end)
+        )
         self.highlight_thread.daemon = True
         self.highlight_thread.start()
 
-    def _highlight_worker(self):
+    def _highlight_worker(self, content, start, end):
         """Worker thread for syntax highlighting"""
         self.is_highlighting = True
 
         try:
-            # Get document content
-            content = self.text_widget.get('1.0', 'end-1c')
-
             if not content.strip():
                 return
 
+            # Matches are relative to the first line of the range
+            self._line_offset = int(start.split('.')[0]) - 1
+
             # Clear existing tags
-            self._clear_syntax_tags()
+            self._clear_syntax_tags(start, end)
 
             # Get language definition
             lang_def = self.languages.get(self.file_type, {})
@@ -464,7 +468,7 @@ class SyntaxHighlighter:
         lines_before = content[:char_pos].count('\n')
         line_start = content.rfind('\n', 0, char_pos)
         col = char_pos - line_start - 1 if line_start != -1 else char_pos
-        return f"{lines_before + 1}.{col}"
+        return f"{lines_before + self._line_offset + 1}.{col}"
 
     def _add_tag_safe(self, tag_name, start_pos, end_pos):
         """Safely add tag in main thread"""
@@ -473,8 +477,8 @@ class SyntaxHighlighter:
         except tk.TclError:
             pass  # Position may be invalid if text was modified
 
-    def _clear_syntax_tags(self):
-        """Clear all syntax highlighting tags"""
+    def _clear_syntax_tags(self, start='1.0', end='end'):
+        """Clear syntax highlighting tags between start and end"""
         tag_names = [
             'syntax_keyword', 'syntax_builtin', 'syntax_string', 'syntax_comment',
             'syntax_number', 'syntax_function', 'syntax_class', 'syntax_decorator',
@@ -484,27 +488,7 @@ class SyntaxHighlighter:
         ]
 
         for tag_name in tag_names:
-            self.text_widget.tag_remove(tag_name, '1.0', 'end')
-
-    def _on_text_change(self, event=None):
-        """Handle text changes for incremental highlighting"""
-        if not self.file_type or self.file_type == 'text':
-            return
-
-        # Debounce highlighting - only highlight after user stops typing
-        if hasattr(self, '_highlight_timer'):
-            self.text_widget.after_cancel(self._highlight_timer)
-
-        self._highlight_timer = self.text_widget.after(500, self._delayed_highlight)
-
-    def _on_modified(self, event=None):
-        """Handle text modification events"""
-        self._on_text_change(event)
-
-    def _delayed_highlight(self):
-        """Delayed highlighting after text changes"""
-        if not self.is_highlighting:
-            self.highlight()
+            self.text_widget.tag_remove(tag_name, start, end)
 
     def toggle_highlighting(self):
         """Toggle syntax highlighting on/off"""
@@ -7,13 +7,31 @@ Usage: python main.py
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, scrolledtext
 import sys
 import os
 from pathlib import Path
 
-# Add the current directory to the path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to the path for imports (frozen builds already have it)
+if not getattr(sys, 'frozen', False):
+    _here = os.path.dirname(os.path.abspath(__file__))
+    if _here not in sys.path:
+        sys.path.insert(0, _here)
+
+# Tk constants resolved once for the text and layout call sites
+_END = tk.END
+_BOTH = tk.BOTH
+_X = tk.X
+_W = tk.W
+_WORD = tk.WORD
+_SUNKEN = tk.SUNKEN
+_BOTTOM = tk.BOTTOM
+
+# Size of each block read from disk when opening a file
+READ_CHUNK_SIZE = 1 << 20
+
+# Number of lines fetched from the text widget per write when saving
+SAVE_CHUNK_LINES = 1024
 
 
 class SafeNotepad:
@@ -28,6 +46,7 @@ class SafeNotepad:
         # Initialize with safe defaults
         self.current_file = None
         self.is_modified = False
+        self._title_update_pending = False
 
         self._create_ui()
         self._setup_events()
@@ -68,33 +87,33 @@ class SafeNotepad:
         self.text_widget = scrolledtext.ScrolledText(
             self.root,
             undo=True,
-            wrap=tk.WORD,
+            wrap=_WORD,
             font=("Consolas", 12)
         )
-        self.text_widget.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self.text_widget.pack(fill=_BOTH, expand=True, padx=2, pady=2)
 
         # Status bar
         self.status_bar = tk.Label(
             self.root,
             text="Ready",
-            relief=tk.SUNKEN,
-            anchor=tk.W
+            relief=_SUNKEN,
+            anchor=_W
         )
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar.pack(side=_BOTTOM, fill=_X)
 
     def _setup_events(self):
         """Setup event bindings"""
         # File operations
-        self.root.bind('<Control-n>', lambda e: self.new_file())
-        self.root.bind('<Control-o>', lambda e: self.open_file())
-        self.root.bind('<Control-s>', lambda e: self.save_file())
+        self.root.bind('<Control-n>', self.new_file)
+        self.root.bind('<Control-o>', self.open_file)
+        self.root.bind('<Control-s>', self.save_file)
 
         # Edit operations
-        self.root.bind('<Control-z>', lambda e: self.undo())
-        self.root.bind('<Control-y>', lambda e: self.redo())
-        self.root.bind('<Control-x>', lambda e: self.cut())
-        self.root.bind('<Control-c>', lambda e: self.copy())
-        self.root.bind('<Control-v>', lambda e: self.paste())
+        self.root.bind('<Control-z>', self.undo)
+        self.root.bind('<Control-y>', self.redo)
+        self.root.bind('<Control-x>', self.cut)
+        self.root.bind('<Control-c>', self.copy)
+        self.root.bind('<Control-v>', self.paste)
 
         # Text change events
         self.text_widget.bind('<<Modified>>', self._on_text_change)
@@ -102,19 +121,20 @@ class SafeNotepad:
         # Window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def new_file(self):
+    def new_file(self, event=None):
         """Create new file"""
         if self.is_modified:
             if not self._ask_save_changes():
                 return
 
-        self.text_widget.delete('1.0', tk.END)
+        self.text_widget.delete('1.0', _END)
+        self.text_widget.edit_modified(False)
         self.current_file = None
         self.is_modified = False
         self._update_title()
         self.status_bar.config(text="New file created")
 
-    def open_file(self):
+    def open_file(self, event=None):
         """Open file"""
         from tkinter import filedialog
 
@@ -133,20 +153,25 @@ class SafeNotepad:
 
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # Read every chunk before touching the buffer so a failed open keeps the document
+                with open(file_path, 'r', encoding='utf-8', buffering=READ_CHUNK_SIZE) as f:
+                    chunks = list(iter(lambda: f.read(READ_CHUNK_SIZE), ''))
+
+                self.text_widget.delete('1.0', _END)
+                for chunk in chunks:
+                    self.text_widget.insert(_END, chunk)
 
-                self.text_widget.delete('1.0', tk.END)
-                self.text_widget.insert('1.0', content)
+                self.text_widget.edit_modified(False)
                 self.current_file = file_path
                 self.is_modified = False
                 self._update_title()
                 self.status_bar.config(text=f"Opened: {file_path}")
 
             except Exception as e:
+                from tkinter import messagebox
                 messagebox.showerror("Error", f"Could not open file: {e}")
 
-    def save_file(self):
+    def save_file(self, event=None):
         """Save file"""
         if self.current_file:
             self._save_to_file(self.current_file)
@@ -175,9 +200,13 @@ class SafeNotepad:
     def _save_to_file(self, file_path):
         """Save content to file"""
         try:
-            content = self.text_widget.get('1.0', 'end-1c')
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Write the buffer in blocks of lines instead of one large string
+            last_line = int(self.text_widget.index('end-1c').split('.')[0])
+            with open(file_path, 'w', encoding='utf-8', buffering=READ_CHUNK_SIZE) as f:
+                for start in range(1, last_line + 1, SAVE_CHUNK_LINES):
+                    stop = start + SAVE_CHUNK_LINES
+                    stop_index = f'{stop}.0' if stop <= last_line else 'end-1c'
+                    f.write(self.text_widget.get(f'{start}.0', stop_index))
 
             self.is_modified = False
             self._update_title()
@@ -185,37 +214,39 @@ class SafeNotepad:
             return True
 
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror("Error", f"Could not save file: {e}")
             return False
 
-    def undo(self):
+    def undo(self, event=None):
         """Undo last action"""
         try:
             self.text_widget.edit_undo()
         except tk.TclError:
             pass
 
-    def redo(self):
+    def redo(self, event=None):
         """Redo last action"""
         try:
             self.text_widget.edit_redo()
         except tk.TclError:
             pass
 
-    def cut(self):
+    def cut(self, event=None):
         """Cut selected text"""
         self.text_widget.event_generate("<<Cut>>")
 
-    def copy(self):
+    def copy(self, event=None):
         """Copy selected text"""
         self.text_widget.event_generate("<<Copy>>")
 
-    def paste(self):
+    def paste(self, event=None):
         """Paste from clipboard"""
         self.text_widget.event_generate("<<Paste>>")
 
     def show_about(self):
         """Show about dialog"""
+        from tkinter import messagebox
         messagebox.showinfo(
             "About",
             "Modern Notepad (Safe Mode)\n\n"
@@ -225,6 +256,15 @@ class SafeNotepad:
 
     def _on_text_change(self, event=None):
         """Handle text changes"""
+        # Coalesce bursts of edits into one title update per idle cycle
+        if self._title_update_pending:
+            return
+        self._title_update_pending = True
+        self.text_widget.after_idle(self._apply_title_update)
+
+    def _apply_title_update(self):
+        """Apply the pending modified-state title update"""
+        self._title_update_pending = False
         if self.text_widget.edit_modified():
             self.is_modified = True
             self._update_title()
@@ -247,6 +287,7 @@ class SafeNotepad:
         if not self.is_modified:
             return True
 
+        from tkinter import messagebox
         result = messagebox.askyesnocancel(
             "Save Changes",
             "Do you want to save changes to the current file?"
@@ -270,6 +311,7 @@ class SafeNotepad:
             self.root.mainloop()
         except Exception as e:
             print(f"Error: {e}")
+            from tkinter import messagebox
             messagebox.showerror("Error", f"An error occurred: {e}")
 
 
@@ -283,6 +325,7 @@ def main():
         app.run()
     except Exception as e:
         print(f"Failed to start even safe mode: {e}")
+        from tkinter import messagebox
         messagebox.showerror("Fatal Error", f"Could not start application: {e}")
 
 
@@ -7,11 +7,21 @@ Version: 1.0.0
 import os
 import shutil
 import sys
+import tempfile
 
 import PyInstaller.__main__
 
 
-def build_executable():
+def get_project_entries(path='.'):
+    """Get the names in a directory with a single directory read"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def build_executable(onefile=False):
     """Build the executable using PyInstaller"""
 
     # Application information
@@ -20,13 +30,16 @@ def build_executable():
     APP_DESCRIPTION = 'Advanced Text Editor with Modern Features'
     APP_AUTHOR = 'Modern Notepad Team'
 
+    # Keep PyInstaller's intermediate files in the system temp directory
+    work_dir = tempfile.mkdtemp(prefix='pyi_')
+
     # Define the build arguments
     args = [
-        '--onefile',  # Create a one-file bundled executable
+        '--onedir',  # One-folder bundle: no unpacking to a temp dir on every launch
         '--windowed',  # Hide console window (GUI app)
         '--name=' + APP_NAME,  # Name of the executable
         '--distpath=dist',  # Output directory
-        '--workpath=build',  # Temporary build directory
+        '--workpath=' + work_dir,  # Temporary build directory
         '--specpath=.',  # Spec file location
         '--clean',  # Clean PyInstaller cache
         '--noconfirm',  # Replace output directory without asking
@@ -36,36 +49,33 @@ def build_executable():
         # Icon (if available)
         '--icon=assets/icons/notepad.ico',
 
-        # Hidden imports for tkinter and dependencies
+        # Hidden imports (everything else is found by PyInstaller's import analysis)
         '--hidden-import=tkinter',
         '--hidden-import=tkinter.ttk',
-        '--hidden-import=tkinter.messagebox',
-        '--hidden-import=tkinter.filedialog',
-        '--hidden-import=tkinter.scrolledtext',
-        '--hidden-import=tkinter.colorchooser',
-        '--hidden-import=tkinter.font',
-        '--hidden-import=tkinter.simpledialog',
-        '--hidden-import=pyspellchecker',
-        '--hidden-import=json',
-        '--hidden-import=pathlib',
-        '--hidden-import=subprocess',
-        '--hidden-import=threading',
-        '--hidden-import=features',
-        '--hidden-import=themes',
-        '--hidden-import=ui',
-        '--hidden-import=utils',
-
-        # Add data files
+        '--hidden-import=spellchecker',
+
+        # Unused standard library packages (urllib stays: pathlib needs urllib.parse)
+        '--exclude-module=unittest',
+        '--exclude-module=doctest',
+        '--exclude-module=pydoc',
+        '--exclude-module=test',
+        '--exclude-module=xml',
+        '--exclude-module=email',
+        '--exclude-module=http',
+
+        # Add data files (Python packages are compiled into the archive)
         '--add-data=assets;assets',
-        '--add-data=features;features',
         '--add-data=themes;themes',
-        '--add-data=ui;ui',
-        '--add-data=utils;utils',
 
         # Main Python file
         'main.py'
     ]
 
+    if onefile:
+        # Single-file build, extracting next to the exe so later launches reuse it
+        args[0] = '--onefile'
+        args.insert(1, '--runtime-tmpdir=.')
+
     print("=" * 60)
     print(f"Building {APP_NAME} v{APP_VERSION}")
     print("=" * 60)
@@ -76,7 +86,7 @@ def build_executable():
     try:
         # Check if icon exists
         icon_path = 'assets/icons/notepad.ico'
-        if not os.path.exists(icon_path):
+        if not os.path.isfile(icon_path):
             print("Warning: Icon file not found. Building without icon.")
             # Remove icon argument
             args = [arg for arg in args if not arg.startswith('--icon=')]
@@ -84,9 +94,10 @@ def build_executable():
             print(f"Using icon: {icon_path}")
 
         # Check for required directories
+        present = get_project_entries()
         required_dirs = ['assets', 'features', 'themes', 'ui', 'utils']
         for dir_name in required_dirs:
-            if not os.path.exists(dir_name):
+            if dir_name not in present:
                 print(f"Warning: Directory '{dir_name}' not found!")
 
         # Run PyInstaller
@@ -97,10 +108,10 @@ def build_executable():
         print("=" * 60)
         print("Build completed successfully!")
         print("=" * 60)
-        print(f"Executable location: {os.path.abspath('dist/' + APP_NAME + '.exe')}")
+        print(f"Executable location: {os.path.abspath(get_executable_path(APP_NAME, onefile))}")
 
         # Create distribution files
-        create_distribution_files(APP_NAME, APP_VERSION, APP_AUTHOR)
+        create_distribution_files(APP_NAME, APP_VERSION, APP_AUTHOR, onefile)
 
         print("\nDistribution files created successfully!")
         print("\nYour Modern Notepad is ready to distribute!")
@@ -109,9 +120,22 @@ def build_executable():
         print(f"Build failed: {e}")
         sys.exit(1)
 
+    finally:
+        # The work directory is never reused, so remove it whatever the outcome
+        shutil.rmtree(work_dir, ignore_errors=True)
+
 
-def create_distribution_files(app_name, app_version, app_author):
+def get_executable_path(app_name, onefile=False):
+    """Get the path of the built executable"""
+    if onefile:
+        return os.path.join('dist', app_name + '.exe')
+    return os.path.join('dist', app_name, app_name + '.exe')
+
+
+def create_distribution_files(app_name, app_version, app_author, onefile=False):
     """Create additional distribution files"""
+    # One-folder builds keep everything next to the executable
+    dist_dir = 'dist' if onefile else os.path.join('dist', app_name)
 
     # Create README for distribution
     dist_readme = f"""Modern Notepad - Distribution Package
@@ -135,6 +159,7 @@ FEATURES:
 
 CONTENTS:
 - {app_name}.exe         : Main application executable
+- _internal/             : Application libraries (one-folder build only)
 - README_DIST.txt        : This file
 - LICENSE.txt            : License information
 
@@ -144,7 +169,7 @@ SYSTEM REQUIREMENTS:
 - 100MB free disk space
 
 INSTALLATION:
-1. Simply run {app_name}.exe
+1. Extract the archive and run {app_name}.exe (keep the folder together)
 2. No additional installation required
 3. Application will create config files automatically
 
@@ -154,7 +179,7 @@ Licensed under MIT License - see LICENSE.txt for details.
 """
 
     try:
-        with open('dist/README_DIST.txt', 'w', encoding='utf-8') as f:
+        with open(os.path.join(dist_dir, 'README_DIST.txt'), 'w', encoding='utf-8') as f:
             f.write(dist_readme)
     except Exception as e:
         print(f"Warning: Could not create dist README: {e}")
@@ -165,13 +190,25 @@ Licensed under MIT License - see LICENSE.txt for details.
         ('README.md', 'README.md'),
     ]
 
+    present = get_project_entries()
     for src, dst in files_to_copy:
         try:
-            if os.path.exists(src):
-                shutil.copy2(src, f'dist/{dst}')
+            if src in present:
+                shutil.copy2(src, os.path.join(dist_dir, dst))
         except Exception as e:
             print(f"Warning: Could not copy {src}: {e}")
 
+    # Zip the one-folder bundle for distribution
+    if not onefile:
+        try:
+            archive = shutil.make_archive(
+                os.path.join('dist', f'{app_name}-{app_version}'), 'zip',
+                root_dir='dist', base_dir=app_name
+            )
+            print(f"Distribution archive: {os.path.abspath(archive)}")
+        except Exception as e:
+            print(f"Warning: Could not create distribution archive: {e}")
+
 
 def clean_build_files():
     """Clean up build files"""
@@ -183,7 +220,7 @@ def clean_build_files():
             try:
                 shutil.rmtree(dir_name)
                 print(f"Cleaned up: {dir_name}")
-            except Exception as e:
+            except OSError as e:
                 print(f"Warning: Could not remove {dir_name}: {e}")
 
     for file_name in files_to_remove:
@@ -201,23 +238,26 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Build Modern Notepad executable')
     parser.add_argument('--clean', action='store_true', help='Clean build files after building')
     parser.add_argument('--test', action='store_true', help='Test the built executable')
+    parser.add_argument('--onefile', action='store_true',
+                        help='Build a single-file executable (slower startup)')
 
     args = parser.parse_args()
 
     # Check if required files exist
-    if not os.path.exists('main.py'):
+    present = get_project_entries()
+    if 'main.py' not in present:
         print("Error: main.py not found!")
         print("Please ensure you are running this script from the project directory.")
         sys.exit(1)
 
     # Check for assets directory
-    if not os.path.exists('assets'):
+    if 'assets' not in present:
         print("Warning: assets directory not found. Creating assets structure...")
         os.makedirs('assets/icons', exist_ok=True)
         print("Please place your notepad.ico file in assets/icons/ directory")
 
     # Build the executable
-    build_executable()
+    build_executable(onefile=args.onefile)
 
     # Test the executable if requested
     if args.test:
@@ -225,7 +265,7 @@ if __name__ == "__main__":
         try:
             import subprocess
 
-            exe_path = 'dist/Modern_Notepad.exe'
+            exe_path = get_executable_path('Modern_Notepad', args.onefile)
             if os.path.exists(exe_path):
                 print(f"Launching {exe_path} for testing...")
                 subprocess.Popen([exe_path])
@@ -244,7 +284,13 @@ if __name__ == "__main__":
     print("Build process completed!")
     print("=" * 60)
     print("\nFiles created in 'dist' directory:")
-    print("• Modern_Notepad.exe - Main application")
-    print("• README_DIST.txt - User documentation")
-    print("• LICENSE.txt - License information")
+    if args.onefile:
+        print("• Modern_Notepad.exe - Main application")
+        print("• README_DIST.txt - User documentation")
+        print("• LICENSE.txt - License information")
+    else:
+        print("• Modern_Notepad/ - Application folder (Modern_Notepad.exe)")
+        print("• Modern_Notepad/README_DIST.txt - User documentation")
+        print("• Modern_Notepad/LICENSE.txt - License information")
+        print("• Modern_Notepad-1.0.0.zip - Distribution archive")
     print("\nYour Modern Notepad is ready for distribution!")
\ No newline at end of file
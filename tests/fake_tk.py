@@ -0,0 +1,92 @@
+from unittest import mock
+
+from ui.editor_window import EditorWindow
+
+
+class FakeText:
+    """Text widget stand-in that keeps Tk's modified flag and queues <<Modified>> like Tk"""
+
+    def __init__(self):
+        self.content = ''
+        self.events = []
+        self._modified = False
+
+    def _set_modified(self, modified):
+        if modified != self._modified:
+            self._modified = modified
+            self.events.append('<<Modified>>')
+
+    def edit_modified(self, modified=None):
+        if modified is None:
+            return self._modified
+        self._set_modified(bool(modified))
+
+    def insert(self, index, text):
+        self.content += text
+        self._set_modified(True)
+
+    def delete(self, first, last=None):
+        self.content = ''
+        self._set_modified(True)
+
+    def get(self, first, last=None):
+        return self.content
+
+    def count(self, first, last, *options):
+        return (len(self.content),)
+
+    def index(self, index):
+        return f"{self.content.count(chr(10)) + 1}.0"
+
+    def edit_reset(self):
+        pass
+
+    def process_events(self, handler):
+        """Deliver queued <<Modified>> events, including those the handler queues"""
+        while self.events:
+            self.events.pop(0)
+            handler()
+
+
+class FakeWindow:
+    """Toplevel stand-in that records its title and scheduled callbacks"""
+
+    def __init__(self):
+        self._title = "Modern Notepad - Untitled"
+        self.scheduled = []
+
+    def title(self, title=None):
+        if title is None:
+            return self._title
+        self._title = title
+
+    def after(self, ms, func, *args):
+        self.scheduled.append((ms, func, args))
+        return f"after#{len(self.scheduled)}"
+
+    def after_cancel(self, after_id):
+        pass
+
+    def winfo_exists(self):
+        return True
+
+
+def make_editor():
+    """An EditorWindow wired to fake widgets, without building any Tk UI"""
+    editor = EditorWindow.__new__(EditorWindow)
+    editor.app = mock.Mock(editor_windows=[])
+    editor.config = mock.Mock()
+    editor.window = FakeWindow()
+    editor.text_widget = FakeText()
+    editor.line_numbers = mock.Mock()
+    editor.status_bar = mock.Mock()
+    editor.current_file = None
+    editor.is_modified = False
+    editor._syntax_highlighter = mock.Mock()
+    editor._char_count = 0
+    editor._word_count = 0
+    editor._word_count_after = None
+    editor._pending_insert = None
+    editor._typed_insert = None
+    editor._status_after = None
+    return editor
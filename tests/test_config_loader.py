@@ -0,0 +1,105 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.config_loader import ConfigLoader
+
+
+class RecentFilesTest(unittest.TestCase):
+    """Recent files persistence through recent.jsonl"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(Path, 'home', return_value=Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _loader(self):
+        config = ConfigLoader()
+        self.addCleanup(config.flush)
+        return config
+
+    def test_round_trip_without_config_json(self):
+        config = self._loader()
+        config.add_recent_file('/a.txt')
+        config.add_recent_file('/b.txt')
+        config.flush()
+
+        self.assertFalse(config.config_file.exists())
+        self.assertEqual(self._loader().get('recent_files'), ['/b.txt', '/a.txt'])
+
+    def test_round_trip_with_corrupt_config_json(self):
+        config = self._loader()
+        config.add_recent_file('/a.txt')
+        config.config_file.write_text('{not json')
+
+        self.assertEqual(self._loader().get('recent_files'), ['/a.txt'])
+
+    def test_remove_is_persisted(self):
+        config = self._loader()
+        config.add_recent_files(['/a.txt', '/b.txt'])
+        config.remove_recent_file('/a.txt')
+
+        self.assertEqual(self._loader().get('recent_files'), ['/b.txt'])
+
+    def test_invalid_max_recent_files_falls_back_to_default(self):
+        config = self._loader()
+        config.add_recent_files([f'/{i}.txt' for i in range(20)])
+        for bad_value in ('5', -1, None):
+            config.config_file.write_text(json.dumps({'max_recent_files': bad_value}))
+            recent_files = self._loader().get('recent_files')
+            self.assertEqual(len(recent_files), config.default_config['max_recent_files'])
+
+    def test_migrates_list_from_config_json(self):
+        config = self._loader()
+        config.config_file.write_text(json.dumps({'recent_files': ['/old.txt']}))
+
+        config = self._loader()
+        config.add_recent_file('/new.txt')
+        self.assertEqual(self._loader().get('recent_files'), ['/new.txt', '/old.txt'])
+
+
+class GetCacheTest(unittest.TestCase):
+    """Resolved values returned by get()"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(Path, 'home', return_value=Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = ConfigLoader()
+        self.addCleanup(self.config.flush)
+
+    def test_writes_invalidate_resolved_values(self):
+        self.assertEqual(self.config.get_font_size(), 12)
+
+        self.config.set('font_size', 14)
+        self.assertEqual(self.config.get_font_size(), 14)
+
+        self.config.update({'font_size': 16, 'theme': 'dark'})
+        self.assertEqual(self.config.get('font_size', 12), 16)
+        self.assertEqual(self.config.get_theme(), 'dark')
+
+        self.config.reset_to_defaults()
+        self.assertEqual(self.config.get_font_size(), 12)
+        self.assertEqual(self.config.get_theme(), 'light')
+
+    def test_fallbacks_depend_on_default(self):
+        self.config.set('font_size', '')
+        self.assertEqual(self.config.get('font_size', 12), 12)
+        self.assertEqual(self.config.get('font_size', 'auto'), '')
+        self.assertEqual(self.config.get('font_size'), '')
+
+    def test_unhashable_default(self):
+        self.config.add_recent_file('/a.txt')
+        self.assertEqual(self.config.get('recent_files', []), ['/a.txt'])
+        self.config.remove_recent_file('/a.txt')
+        self.assertEqual(self.config.get('recent_files', []), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
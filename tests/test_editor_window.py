@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from ui.editor_window import WORD_COUNT_DELAY_MS, EditorWindow
+from tests.fake_tk import make_editor
+
+
+def _fake_window(app, session=None):
+    """Stand-in for an EditorWindow with just what restore_session touches"""
+    file_ops = mock.Mock()
+    file_ops.read_file.side_effect = lambda path: f"content of {os.path.basename(path)}"
+    return SimpleNamespace(
+        app=app,
+        config=mock.Mock(get_session=mock.Mock(return_value=session)),
+        file_ops=file_ops,
+        text_widget=mock.Mock(),
+    )
+
+
+class RestoreSessionTest(unittest.TestCase):
+    """Restoring a multi-window session"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.paths = []
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            path = os.path.join(self._tmp.name, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(name)
+            self.paths.append(path)
+
+        self.app = mock.Mock()
+        self.created = []
+
+        def new_window(restore=True):
+            window = _fake_window(self.app)
+            self.created.append((window, restore))
+            return window
+
+        self.app.new_window.side_effect = new_window
+
+    def test_each_file_opens_once_in_its_own_window(self):
+        session = {'windows': [
+            {'file_path': self.paths[0], 'cursor_position': '2.0'},
+            {'file_path': self.paths[1]},
+            {'file_path': self.paths[2]},
+        ]}
+        window = _fake_window(self.app, session)
+
+        EditorWindow.restore_session(window)
+
+        window.file_ops.open_file.assert_called_once_with(self.paths[0], preloaded='content of a.txt')
+        window.text_widget.mark_set.assert_called_once_with('insert', '2.0')
+        self.assertEqual([restore for _, restore in self.created], [False, False])
+        for (new, _), path in zip(self.created, self.paths[1:]):
+            new.file_ops.open_file.assert_called_once_with(
+                path, preloaded=f"content of {os.path.basename(path)}"
+            )
+            new.config.get_session.assert_not_called()
+
+    def test_unreadable_first_file_keeps_this_window_for_the_next(self):
+        session = {'windows': [{'file_path': self.paths[0]}, {'file_path': self.paths[1]}]}
+        window = _fake_window(self.app, session)
+
+        def read_file(path):
+            if path == self.paths[0]:
+                raise OSError("unreadable")
+            return "b"
+
+        window.file_ops.read_file.side_effect = read_file
+
+        EditorWindow.restore_session(window)
+
+        window.file_ops.open_file.assert_called_once_with(self.paths[1], preloaded="b")
+        self.assertEqual(self.created, [])
+
+    def test_missing_files_are_skipped(self):
+        session = {'windows': [{'file_path': os.path.join(self._tmp.name, 'gone.txt')}]}
+        window = _fake_window(self.app, session)
+
+        EditorWindow.restore_session(window)
+
+        window.file_ops.open_file.assert_not_called()
+        self.app.new_window.assert_not_called()
+
+
+class WordCountTest(unittest.TestCase):
+    """Incremental word counting for typed characters"""
+
+    def setUp(self):
+        self.editor = make_editor()
+        self.editor.text_widget.content = "hello "
+        self.editor._char_count = 6
+        self.editor._word_count = 1
+
+    def _full_recounts(self):
+        return [ms for ms, _, _ in self.editor.window.scheduled if ms == WORD_COUNT_DELAY_MS]
+
+    def test_typed_character_takes_the_delta_path(self):
+        editor = self.editor
+        editor._pending_insert = ('x', ' ', '')
+        editor.text_widget.insert('insert', 'x')
+
+        # The real edit (flag set), then the echo from clearing the flag
+        editor._on_modified()
+        self.assertFalse(editor.text_widget.edit_modified())
+        editor._on_modified()
+
+        editor._update_counts_deferred()
+        self.assertEqual(editor._word_count, 2)
+        self.assertEqual(editor._char_count, 7)
+        self.assertEqual(self._full_recounts(), [])
+        self.assertTrue(editor.is_modified)
+
+    def test_edit_without_keypress_recounts(self):
+        editor = self.editor
+        editor.text_widget.insert('insert', 'x')
+        editor.text_widget.process_events(editor._on_modified)
+
+        editor._update_counts_deferred()
+        self.assertEqual(editor._word_count, 1)
+        self.assertTrue(self._full_recounts())
+
+
+class SaveDoneTest(unittest.TestCase):
+    """Reporting background saves"""
+
+    def test_failed_save_after_window_closed_still_reports(self):
+        editor = make_editor()
+        editor.window.winfo_exists = mock.Mock(return_value=False)
+        editor.window.title = mock.Mock(side_effect=AssertionError("window is gone"))
+        future = mock.Mock(exception=mock.Mock(return_value=OSError("disk full")))
+
+        with mock.patch('ui.editor_window.messagebox') as messagebox:
+            editor._on_save_done('/tmp/notes.txt', future)
+
+        messagebox.showerror.assert_called_once()
+        editor.app.logger.log_file_operation.assert_called_once_with("Save file", '/tmp/notes.txt', False)
+        self.assertFalse(editor.is_modified)
+
+    def test_failed_save_marks_open_window_modified(self):
+        editor = make_editor()
+        future = mock.Mock(exception=mock.Mock(return_value=OSError("disk full")))
+
+        with mock.patch('ui.editor_window.messagebox'):
+            editor._on_save_done('/tmp/notes.txt', future)
+
+        self.assertTrue(editor.is_modified)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from features.file_ops import FileOperations
+from tests.fake_tk import make_editor
+
+
+class OpenFileTest(unittest.TestCase):
+    """Documents loaded by FileOperations start out unmodified"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(Path, 'home', return_value=Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.editor = make_editor()
+        self.file_ops = FileOperations(self.editor)
+
+        self.path = os.path.join(self._tmp.name, 'notes.txt')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write("hello world\n")
+
+    def test_opened_file_is_not_dirty(self):
+        self.assertTrue(self.file_ops.open_file(self.path))
+        self.editor.text_widget.process_events(self.editor._on_modified)
+
+        self.assertFalse(self.editor.is_modified)
+        self.assertFalse(self.editor.window.title().endswith(' *'))
+
+    def test_preloaded_file_is_not_dirty(self):
+        self.file_ops.open_file(self.path, preloaded="restored\n")
+        self.editor.text_widget.process_events(self.editor._on_modified)
+
+        self.assertFalse(self.editor.is_modified)
+
+    def test_new_file_is_not_dirty(self):
+        self.editor.text_widget.insert('1.0', "draft")
+        self.editor.text_widget.edit_modified(False)
+        self.editor.text_widget.events.clear()
+
+        self.file_ops.new_file()
+        self.editor.text_widget.process_events(self.editor._on_modified)
+
+        self.assertFalse(self.editor.is_modified)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,18 +4,47 @@ Editor Window - Main text editor interface
 
 import json
 import os
+import time
 import tkinter as tk
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
 
 from features.autosave import AutoSave
 from features.file_ops import FileOperations
 from features.search_replace import SearchReplace
-from features.spell_checker import SpellChecker
-from features.syntax_highlighter import SyntaxHighlighter
 from ui.menu_bar import MenuBar
 from ui.settings_window import SettingsWindow
 
+# Delay used to coalesce line number redraws (milliseconds)
+UPDATE_DELAY_MS = 50
+
+# Delay before recounting words after the text changes (milliseconds)
+WORD_COUNT_DELAY_MS = 300
+HIGHLIGHT_DELAY_MS = 75
+STATUS_DELAY_MS = 40
+
+# Interval at which the Tk thread checks background work for completion (milliseconds)
+FUTURE_POLL_MS = 20
+
+# Control and Alt (Mod1 on X11 and macOS, 0x20000 on Windows): such keys are shortcuts, not text
+_SHORTCUT_STATE_MASK = 0x0004 | 0x0008 | 0x20000
+
+# Theme appliers shared by all editor windows, keyed by (path, mtime)
+_THEME_CACHE = {}
+
+# Format used by Insert Date/Time (F5)
+_DT_FMT = "%Y-%m-%d %H:%M:%S"
+
+# Line number strings shared by all windows; _LINE_STRS[i] == str(i)
+_LINE_STRS = ['']
+
+
+def _get_line_strs(n):
+    """Return the cached line number strings, grown to cover 1..n"""
+    while len(_LINE_STRS) <= n:
+        _LINE_STRS.append(str(len(_LINE_STRS)))
+    return _LINE_STRS
+
 
 class LineNumberWidget(tk.Text):
     """Widget to display line numbers"""
@@ -34,32 +63,47 @@ class LineNumberWidget(tk.Text):
             foreground='#666666'
         )
 
-        # Bind text widget events
-        self.text_widget.bind('<KeyPress>', self.on_key_press)
-        self.text_widget.bind('<Button-1>', self.on_click)
-        self.text_widget.bind('<MouseWheel>', self.on_mousewheel)
+        # Pending coalesced update and number of lines currently rendered
+        self._pending_update = None
+        self._last_line_count = 0
 
         self.update_line_numbers()
 
-    def on_key_press(self, event=None):
-        self.after_idle(self.update_line_numbers)
+    def on_scroll(self, first):
+        """Follow the text widget's view"""
+        self.yview_moveto(float(first))
+        self.on_text_modified()
 
-    def on_click(self, event=None):
-        self.after_idle(self.update_line_numbers)
+    def on_text_modified(self):
+        """Schedule a rebuild only if lines were added or removed"""
+        if int(self.text_widget.index('end-1c').split('.')[0]) != self._last_line_count:
+            self._schedule_update()
 
-    def on_mousewheel(self, event=None):
-        self.after_idle(self.update_line_numbers)
+    def _schedule_update(self):
+        """Coalesce bursts of events into one update after a short delay"""
+        if self._pending_update:
+            self.after_cancel(self._pending_update)
+        self._pending_update = self.after(UPDATE_DELAY_MS, self._do_update)
+
+    def _do_update(self):
+        self._pending_update = None
+        self.update_line_numbers()
 
     def update_line_numbers(self):
         """Update line numbers display"""
-        self.config(state='normal')
-        self.delete('1.0', 'end')
-
         line_count = int(self.text_widget.index('end-1c').split('.')[0])
-        line_numbers = '\n'.join(str(i) for i in range(1, line_count + 1))
-        self.insert('1.0', line_numbers)
-
-        self.config(state='disabled')
+        last_count = self._last_line_count
+
+        # Only render the lines that were added or removed since last time
+        if line_count != last_count:
+            self.config(state='normal')
+            if line_count > last_count:
+                line_numbers = '\n'.join(_get_line_strs(line_count)[last_count + 1:line_count + 1])
+                self.insert('end-1c', '\n' + line_numbers if last_count else line_numbers)
+            else:
+                self.delete(f'{line_count}.end', 'end-1c')
+            self.config(state='disabled')
+            self._last_line_count = line_count
 
         # Sync scrolling
         self.yview_moveto(self.text_widget.yview()[0])
@@ -102,6 +146,9 @@ class StatusBar(ttk.Frame):
 class EditorWindow:
     """Main editor window class"""
 
+    # Shared worker for disk reads that should not block the Tk main loop
+    _io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='editor-io')
+
     def __init__(self, app, config):
         self.app = app
         self.config = config
@@ -110,6 +157,15 @@ class EditorWindow:
         self.is_modified = False
         self.zoom_level = 0
 
+        # Cached document statistics
+        self._char_count = 0
+        self._word_count = 0
+        self._word_count_after = None
+        self._pending_insert = None
+        self._typed_insert = None
+        self._hl_after = None
+        self._status_after = None
+
         # UI Components
         self.text_widget = None
         self.line_numbers = None
@@ -119,19 +175,18 @@ class EditorWindow:
         # Feature modules
         self.file_ops = None
         self.search_replace = None
-        self.syntax_highlighter = None
-        self.spell_checker = None
+        self._syntax_highlighter = None
+        self._spell_checker = None
         self.autosave = None
 
         # Theme and settings
-        self.current_theme = self.config.get('theme', 'light')
-        self.font_family = self.config.get('font_family', 'Consolas')
-        self.font_size = self.config.get('font_size', 12)
+        self.current_theme = self.config.get_theme()
+        self.font_family = self.config.get_font_family()
+        self.font_size = self.config.get_font_size()
 
         self._create_window()
         self._setup_ui()
         self._setup_features()
-        self._setup_bindings()
         self._apply_theme()
 
     def _create_window(self):
@@ -210,7 +265,8 @@ class EditorWindow:
         self.text_widget = tk.Text(
             text_container,
             undo=True,
-            maxundo=50,
+            maxundo=self.config.get('max_undo', 20),
+            autoseparators=True,
             wrap=tk.WORD,
             font=(self.font_family, self.font_size),
             insertbackground='black',
@@ -220,8 +276,9 @@ class EditorWindow:
         # Create scrollbars
         v_scrollbar = ttk.Scrollbar(text_container, orient=tk.VERTICAL, command=self.text_widget.yview)
         h_scrollbar = ttk.Scrollbar(text_container, orient=tk.HORIZONTAL, command=self.text_widget.xview)
+        self._v_scrollbar = v_scrollbar
 
-        self.text_widget.config(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.text_widget.config(yscrollcommand=self._on_yscroll, xscrollcommand=h_scrollbar.set)
 
         # Pack scrollbars and text widget
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -234,113 +291,255 @@ class EditorWindow:
 
         # Setup text widget events
         self.text_widget.bind('<KeyRelease>', self._on_text_change)
-        self.text_widget.bind('<Button-1>', self._on_cursor_move)
-        self.text_widget.bind('<KeyPress>', self._on_cursor_move)
+        self.text_widget.bind('<ButtonRelease-1>', self._on_cursor_move)
+        self.text_widget.bind('<KeyPress>', self._capture_typed_char)
         self.text_widget.bind('<<Modified>>', self._on_modified)
+        self.text_widget.bind('<Configure>', self._schedule_highlight)
 
     def _setup_features(self):
         """Initialize feature modules"""
         self.file_ops = FileOperations(self)
         self.search_replace = SearchReplace(self)
-        self.syntax_highlighter = SyntaxHighlighter(self.text_widget)
-        self.spell_checker = SpellChecker(self.text_widget)
         self.autosave = AutoSave(self)
 
-    def _setup_bindings(self):
-        """Setup keyboard bindings"""
-        # File operations
-        self.window.bind('<Control-n>', lambda e: self.new_file())
-        self.window.bind('<Control-o>', lambda e: self.open_file())
-        self.window.bind('<Control-s>', lambda e: self.save_file())
-        self.window.bind('<Control-Shift-S>', lambda e: self.save_as_file())
-
-        # Edit operations
-        self.window.bind('<Control-z>', lambda e: self.undo())
-        self.window.bind('<Control-y>', lambda e: self.redo())
-        self.window.bind('<Control-x>', lambda e: self.cut())
-        self.window.bind('<Control-c>', lambda e: self.copy())
-        self.window.bind('<Control-v>', lambda e: self.paste())
-        self.window.bind('<Control-a>', lambda e: self.select_all())
-
-        # Search operations
-        self.window.bind('<Control-f>', lambda e: self.show_find_dialog())
-        self.window.bind('<Control-h>', lambda e: self.show_replace_dialog())
-        self.window.bind('<Control-g>', lambda e: self.show_goto_line())
-
-        # Zoom operations
-        self.window.bind('<Control-plus>', lambda e: self.zoom_in())
-        self.window.bind('<Control-equal>', lambda e: self.zoom_in())  # For keyboards without numpad
-        self.window.bind('<Control-minus>', lambda e: self.zoom_out())
-        self.window.bind('<Control-0>', lambda e: self.reset_zoom())
-
-        # Other
-        self.window.bind('<F5>', lambda e: self.insert_datetime())
-        self.window.bind('<F11>', lambda e: self.toggle_fullscreen())
+        # Real-time checking is bound when the checker is built, so build it now if it is on
+        if self.config.get('spell_check_enabled', True):
+            from features.spell_checker import SPELLCHECKER_AVAILABLE, SpellChecker
+            if SPELLCHECKER_AVAILABLE:
+                self._spell_checker = SpellChecker(self.text_widget)
+
+    @property
+    def syntax_highlighter(self):
+        """Syntax highlighter, imported and created on first use"""
+        if self._syntax_highlighter is None:
+            from features.syntax_highlighter import SyntaxHighlighter
+            self._syntax_highlighter = SyntaxHighlighter(self.text_widget)
+        return self._syntax_highlighter
+
+    @property
+    def spell_checker(self):
+        """Spell checker, imported and created on first use"""
+        if self._spell_checker is None:
+            from features.spell_checker import SpellChecker
+            self._spell_checker = SpellChecker(self.text_widget)
+        return self._spell_checker
+
+    @property
+    def spell_checker_loaded(self):
+        """Whether the spell checker has been created yet"""
+        return self._spell_checker is not None
 
     def _apply_theme(self):
         """Apply current theme to the editor"""
-        theme_path = os.path.join('themes', f'{self.current_theme}.json')
-        if os.path.exists(theme_path):
-            try:
-                with open(theme_path, 'r') as f:
-                    theme_data = json.load(f)
-
-                # Apply theme to text widget
-                text_colors = theme_data.get('text_widget', {})
-                self.text_widget.config(
-                    bg=text_colors.get('background', '#ffffff'),
-                    fg=text_colors.get('foreground', '#000000'),
-                    insertbackground=text_colors.get('cursor', '#000000'),
-                    selectbackground=text_colors.get('selection', '#316AC5')
-                )
-
-                # Update line numbers colors
-                line_colors = theme_data.get('line_numbers', {})
-                self.line_numbers.config(
-                    bg=line_colors.get('background', '#f0f0f0'),
-                    fg=line_colors.get('foreground', '#666666')
-                )
+        # Read the theme file off the UI thread, then apply it on the Tk thread
+        theme_name = self.current_theme
+        future = self._io_executor.submit(self._load_theme_sync, theme_name)
+        self.call_when_done(future, self._on_theme_loaded, theme_name)
+
+    def call_when_done(self, future, callback, *args):
+        """Call callback(*args, future) on the Tk thread once the future has finished"""
+        # Tk may only be called from its own thread, so poll rather than use add_done_callback
+        if future.done():
+            callback(*args, future)
+        else:
+            self.window.after(FUTURE_POLL_MS, self.call_when_done, future, callback, *args)
+
+    @staticmethod
+    def _load_theme_sync(theme_name):
+        """Load a theme applier from disk (runs in a worker thread)"""
+        theme_path = os.path.join('themes', f'{theme_name}.json')
+        try:
+            mtime = os.path.getmtime(theme_path)
+        except OSError:
+            return None
+
+        # Reuse the parsed theme until the file changes on disk
+        key = (theme_path, mtime)
+        theme_applier = _THEME_CACHE.get(key)
+        if theme_applier is None:
+            with open(theme_path, 'r') as f:
+                theme_applier = EditorWindow._build_theme_applier(json.load(f))
+            _THEME_CACHE[key] = theme_applier
+        return theme_applier
+
+    @staticmethod
+    def _build_theme_applier(theme_data):
+        """Resolve theme colors once and return a function applying them to the editor widgets"""
+        text_colors = theme_data.get('text_widget', {})
+        text_options = {
+            'bg': text_colors.get('background', '#ffffff'),
+            'fg': text_colors.get('foreground', '#000000'),
+            'insertbackground': text_colors.get('cursor', '#000000'),
+            'selectbackground': text_colors.get('selection', '#316AC5')
+        }
+
+        line_colors = theme_data.get('line_numbers', {})
+        line_options = {
+            'bg': line_colors.get('background', '#f0f0f0'),
+            'fg': line_colors.get('foreground', '#666666')
+        }
+
+        def apply(text_widget, line_numbers):
+            text_widget.config(**text_options)
+            line_numbers.config(**line_options)
+
+        return apply
+
+    def _on_theme_loaded(self, theme_name, future):
+        """Apply a loaded theme unless a newer one was requested meanwhile"""
+        if theme_name != self.current_theme:
+            return
 
-            except Exception as e:
-                print(f"Error loading theme: {e}")
+        try:
+            theme_applier = future.result()
+            if theme_applier is not None:
+                theme_applier(self.text_widget, self.line_numbers)
+        except tk.TclError:
+            pass  # Window was closed before the theme finished loading
+        except Exception as e:
+            print(f"Error loading theme: {e}")
 
     def _on_text_change(self, event=None):
-        """Handle text changes"""
-        self._update_status_bar()
-
-        # Trigger syntax highlighting
-        if self.syntax_highlighter and self.current_file:
-            self.syntax_highlighter.highlight()
+        """Handle key releases, once the key has moved the cursor or edited the text"""
+        # A keypress that made no edit must not leave its character for a later edit
+        self._pending_insert = None
+        self._update_cursor_only()
+
+        self._schedule_highlight()
+
+    def _schedule_highlight(self, event=None):
+        """Coalesce syntax highlighting until typing or scrolling pauses"""
+        if self.current_file and self.syntax_highlighter:
+            if self._hl_after:
+                self.window.after_cancel(self._hl_after)
+            self._hl_after = self.window.after(HIGHLIGHT_DELAY_MS, self._do_highlight)
+
+    def _do_highlight(self):
+        """Highlight only the lines currently visible in the text widget"""
+        self._hl_after = None
+        first = self.text_widget.index('@0,0')
+        last = self.text_widget.index(f'@0,{self.text_widget.winfo_height()}')
+        self.syntax_highlighter.highlight(first, last)
+
+    def _on_yscroll(self, first, last):
+        """Forward scroll updates to the scrollbar, line numbers and highlighter"""
+        self._v_scrollbar.set(first, last)
+        if self.line_numbers:
+            self.line_numbers.on_scroll(first)
+        self._schedule_highlight()
 
     def _on_cursor_move(self, event=None):
         """Handle cursor movement"""
-        self.window.after_idle(self._update_status_bar)
-
-    def _on_modified(self, event=None):
-        """Handle text modification"""
-        if self.text_widget.edit_modified():
-            self.set_modified(True)
-            self.text_widget.edit_modified(False)
+        self._update_cursor_only()
 
-    def _update_status_bar(self):
-        """Update status bar information"""
-        # Get cursor position
-        cursor_pos = self.text_widget.index(tk.INSERT)
-        line, col = cursor_pos.split('.')
+    def _update_cursor_only(self):
+        """Show the cursor position; cheap enough to run on every key or click"""
+        line, col = self.text_widget.index(tk.INSERT).split('.')
         self.status_bar.update_cursor_position(int(line), int(col) + 1)
 
-        # Get text statistics
-        content = self.text_widget.get('1.0', 'end-1c')
-        words = len(content.split()) if content.strip() else 0
-        chars = len(content)
-        self.status_bar.update_counts(words, chars)
+    def _schedule_status_update(self):
+        """Coalesce count refreshes from bursts of edits into one"""
+        if self._status_after:
+            self.window.after_cancel(self._status_after)
+        self._status_after = self.window.after(STATUS_DELAY_MS, self._update_counts_deferred)
+
+    def _capture_typed_char(self, event):
+        """Remember a single typed character so word counts can be updated incrementally"""
+        char = getattr(event, 'char', '')
+        if len(char) != 1 or not (char.isprintable() or char.isspace()):
+            return
+        if event.state & _SHORTCUT_STATE_MASK:
+            return
+        if self.text_widget.tag_ranges('sel'):
+            return  # Typing over a selection replaces it
+
+        before = self.text_widget.get('insert-1c') if self.text_widget.compare('insert', '>', '1.0') else ''
+        after = self.text_widget.get('insert')
+        self._pending_insert = (char, before, after)
+
+    @staticmethod
+    def _word_count_delta(char, before, after):
+        """Change in word count caused by inserting char between before and after"""
+        before_word = bool(before) and not before.isspace()
+        after_word = bool(after) and not after.isspace()
+        if char.isspace():
+            # Whitespace inside a word splits it in two
+            return 1 if before_word and after_word else 0
+        # Anything else starts a new word unless it touches an existing one
+        return 0 if before_word or after_word else 1
 
-        # Update modified status
-        self.status_bar.update_modified_status(self.is_modified)
+    def _on_modified(self, event=None):
+        """Handle text modification"""
+        # Clearing the flag below queues another <<Modified>>; ignore that echo
+        if not self.text_widget.edit_modified():
+            return
+
+        self.line_numbers.on_text_modified()
+        self._schedule_status_update()
+
+        # Hand the typed character to this edit only; edits without one recount
+        self._typed_insert = self._pending_insert
+        self._pending_insert = None
+        if self._typed_insert is None:
+            self._schedule_word_count()
+        self.set_modified(True)
+        self.text_widget.edit_modified(False)
+
+    def refresh_document_state(self):
+        """Update line numbers and counts after the whole document was replaced"""
+        # Loads clear the modified flag, so _on_modified ignores their events
+        self.line_numbers.on_text_modified()
+        self._typed_insert = None
+        self._schedule_status_update()
+        self._schedule_word_count()
+
+    def _update_counts_deferred(self):
+        """Update the word/character counts after an edit"""
+        self._status_after = None
+
+        # Count characters inside Tk instead of copying the document out
+        chars = (self.text_widget.count('1.0', 'end-1c', 'chars') or (0,))[0]
+        if chars != self._char_count:
+            pending = self._typed_insert
+            if pending is not None and chars == self._char_count + 1:
+                # Single typed character: adjust the cached word count in place
+                self._word_count += self._word_count_delta(*pending)
+            else:
+                self._schedule_word_count()
+            self._char_count = chars
+        self._typed_insert = None
+        self.status_bar.update_counts(self._word_count, chars)
+
+    def _schedule_word_count(self):
+        """Recount words once the user pauses typing"""
+        if self._word_count_after:
+            self.window.after_cancel(self._word_count_after)
+        self._word_count_after = self.window.after(WORD_COUNT_DELAY_MS, self._update_word_count)
+
+    def _update_word_count(self):
+        """Recount words in the document"""
+        self._word_count_after = None
+        content = self.text_widget.get('1.0', 'end-1c')
+        self._word_count = len(content.split())
+        self.status_bar.update_counts(self._word_count, self._char_count)
+
+    def get_document_stats(self):
+        """Return (words, chars, lines), reusing the cached counts when they are current"""
+        chars = (self.text_widget.count('1.0', 'end-1c', 'chars') or (0,))[0]
+        lines = int(self.text_widget.index('end-1c').split('.')[0])
+        if self._word_count_after is None and self._status_after is None:
+            words = self._word_count
+        else:
+            words = len(self.text_widget.get('1.0', 'end-1c').split())
+        return words, chars, lines
 
     def set_modified(self, modified=True):
         """Set the modified state"""
+        if modified == self.is_modified:
+            return  # Title already reflects this state
+
         self.is_modified = modified
+        self.status_bar.update_modified_status(modified)
         title = self.window.title()
 
         if modified and not title.endswith(' *'):
@@ -363,8 +562,8 @@ class EditorWindow:
             )
             if result is None:  # Cancel
                 return False
-            elif result:  # Yes, save
-                if not self.save_file():
+            elif result:  # Yes, save (synchronously, the window is about to go)
+                if not self.file_ops.save_file():
                     return False
 
         # Stop autosave
@@ -394,22 +593,41 @@ class EditorWindow:
     def restore_session(self):
         """Restore session data"""
         session_data = self.config.get_session()
-        if session_data and 'windows' in session_data:
-            windows = session_data['windows']
-            if windows:
-                # Restore first window in this instance
-                window_data = windows[0]
-                if 'file_path' in window_data and os.path.exists(window_data['file_path']):
-                    self.file_ops.open_file(window_data['file_path'])
-                    if 'cursor_position' in window_data:
-                        self.text_widget.mark_set(tk.INSERT, window_data['cursor_position'])
-                        self.text_widget.see(tk.INSERT)
-
-                # Create additional windows for remaining files
-                for window_data in windows[1:]:
-                    if 'file_path' in window_data and os.path.exists(window_data['file_path']):
-                        self.app.new_window()
-                        # The new window will handle its own restoration
+        if not session_data or 'windows' not in session_data:
+            return
+
+        windows = [
+            window_data for window_data in session_data['windows']
+            if 'file_path' in window_data and os.path.exists(window_data['file_path'])
+        ]
+        if not windows:
+            return
+
+        # Read all files concurrently; widgets are still built on the Tk thread
+        with ThreadPoolExecutor(max_workers=min(len(windows), 8)) as executor:
+            futures = [
+                executor.submit(self.file_ops.read_file, window_data['file_path'])
+                for window_data in windows
+            ]
+
+        # This window takes the first file; the app must not restore the session again in the others
+        editor = self
+        for window_data, future in zip(windows, futures):
+            try:
+                content = future.result()
+            except Exception as e:
+                self.app.logger.log_error_with_context(
+                    str(e), f"Restoring session file: {window_data['file_path']}"
+                )
+                continue
+
+            if editor is None:
+                editor = self.app.new_window(restore=False)
+            editor.file_ops.open_file(window_data['file_path'], preloaded=content)
+            if 'cursor_position' in window_data:
+                editor.text_widget.mark_set(tk.INSERT, window_data['cursor_position'])
+                editor.text_widget.see(tk.INSERT)
+            editor = None
 
     # File operations
     def new_file(self):
@@ -419,7 +637,35 @@ class EditorWindow:
         self.file_ops.open_file()
 
     def save_file(self):
-        return self.file_ops.save_file()
+        """Save the current file, writing it to disk on the I/O thread"""
+        if self.current_file is None:
+            return self.file_ops.save_as_file()
+
+        # Tk is not thread-safe, so snapshot the text here
+        file_path = self.current_file
+        content = self.text_widget.get('1.0', 'end-1c')
+        self.set_modified(False)
+
+        future = self._io_executor.submit(self.file_ops.write_to_disk, file_path, content)
+        self.call_when_done(future, self._on_save_done, file_path)
+        return True
+
+    def _on_save_done(self, file_path, future):
+        """Report the result of a background save"""
+        error = future.exception()
+        if error is None:
+            self.app.logger.log_file_operation("Save file", file_path, True)
+            return
+
+        self.app.logger.log_file_operation("Save file", file_path, False)
+        self.app.logger.log_error_with_context(str(error), f"Saving file: {file_path}")
+
+        # The window may have been closed while the write was running
+        if self.window.winfo_exists():
+            self.set_modified(True)
+            messagebox.showerror("Error", f"Error saving file: {error}", parent=self.window)
+        else:
+            messagebox.showerror("Error", f"Error saving file {file_path}: {error}")
 
     def save_as_file(self):
         return self.file_ops.save_as_file()
@@ -483,8 +729,7 @@ class EditorWindow:
 
     # Utility functions
     def insert_datetime(self):
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.text_widget.insert(tk.INSERT, current_time)
+        self.text_widget.insert(tk.INSERT, time.strftime(_DT_FMT))
 
     def show_settings(self):
         """Show settings window"""
@@ -3,470 +3,476 @@ Menu Bar - Application menu system
 """
 
 import os
+import re
 import tkinter as tk
-import webbrowser
-from tkinter import messagebox
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from tkinter import colorchooser, messagebox
+from tkinter.simpledialog import askstring
 
+# Existing recent files shared by all windows, keyed by the configured list
+_RECENT_CACHE = {}
 
-class MenuBar:
-    """Menu bar for the editor window"""
-
-    def __init__(self, editor):
-        self.editor = editor
-        self.menubar = tk.Menu(editor.window)
-        self._create_menus()
-
-    def _create_menus(self):
-        """Create all menu items"""
-        self._create_file_menu()
-        self._create_edit_menu()
-        self._create_view_menu()
-        self._create_search_menu()
-        self._create_format_menu()
-        self._create_tools_menu()
-        self._create_help_menu()
-
-    def _create_file_menu(self):
-        """Create File menu"""
-        file_menu = tk.Menu(self.menubar, tearoff=0)
-
-        file_menu.add_command(
-            label="New",
-            accelerator="Ctrl+N",
-            command=self.editor.new_file
-        )
-        file_menu.add_command(
-            label="New Window",
-            accelerator="Ctrl+Shift+N",
-            command=self.editor.app.new_window
-        )
-        file_menu.add_separator()
-
-        file_menu.add_command(
-            label="Open...",
-            accelerator="Ctrl+O",
-            command=self.editor.open_file
-        )
-
-        # Recent files submenu
-        self.recent_menu = tk.Menu(file_menu, tearoff=0)
-        file_menu.add_cascade(label="Recent Files", menu=self.recent_menu)
-        self._update_recent_files()
-
-        file_menu.add_separator()
+# Menu bars whose recent files menu has been built
+_RECENT_MENUS = weakref.WeakSet()
 
-        file_menu.add_command(
-            label="Save",
-            accelerator="Ctrl+S",
-            command=self.editor.save_file
-        )
-        file_menu.add_command(
-            label="Save As...",
-            accelerator="Ctrl+Shift+S",
-            command=self.editor.save_as_file
-        )
-        file_menu.add_command(
-            label="Save All",
-            command=self._save_all_files
-        )
+# Leading indentation removed by Decrease Indent
+_DEDENT_RE = re.compile(r'^(    |\t)', re.M)
 
-        file_menu.add_separator()
+# Text shown by Help > Keyboard Shortcuts
+_SHORTCUTS_TEXT = """
+Keyboard Shortcuts:
 
-        # Import/Export submenu
-        import_export_menu = tk.Menu(file_menu, tearoff=0)
-        import_export_menu.add_command(label="Import from Word Document...", command=self._import_docx)
-        import_export_menu.add_command(label="Export to PDF...", command=self._export_pdf)
-        import_export_menu.add_command(label="Export to HTML...", command=self._export_html)
-        file_menu.add_cascade(label="Import/Export", menu=import_export_menu)
+File Operations:
+Ctrl+N - New file
+Ctrl+O - Open file
+Ctrl+S - Save file
+Ctrl+Shift+S - Save as
+Ctrl+W - Close file
+Alt+F4 - Exit
 
-        file_menu.add_separator()
+Edit Operations:
+Ctrl+Z - Undo
+Ctrl+Y - Redo
+Ctrl+X - Cut
+Ctrl+C - Copy
+Ctrl+V - Paste
+Ctrl+A - Select all
+Del - Delete
 
-        file_menu.add_command(
-            label="Page Setup...",
-            command=self._page_setup
-        )
-        file_menu.add_command(
-            label="Print...",
-            accelerator="Ctrl+P",
-            command=self._print_file
-        )
+Search Operations:
+Ctrl+F - Find
+Ctrl+H - Replace
+Ctrl+G - Go to line
+F3 - Find next
+Shift+F3 - Find previous
 
-        file_menu.add_separator()
+View Operations:
+Ctrl++ - Zoom in
+Ctrl+- - Zoom out
+Ctrl+0 - Reset zoom
+F11 - Full screen
 
-        file_menu.add_command(
-            label="Close",
-            accelerator="Ctrl+W",
-            command=self.editor.close
-        )
-        file_menu.add_command(
-            label="Exit",
-            accelerator="Alt+F4",
-            command=self.editor.app.quit
-        )
+Other:
+F5 - Insert date/time
+F7 - Spell check
+F1 - Show this help
+"""
 
-        self.menubar.add_cascade(label="File", menu=file_menu)
+# Text shown by Help > About
+_ABOUT_TEXT = """
+Modern Notepad v1.0
 
-    def _create_edit_menu(self):
-        """Create Edit menu"""
-        edit_menu = tk.Menu(self.menubar, tearoff=0)
+A full-featured text editor built with Python and Tkinter.
 
-        edit_menu.add_command(
-            label="Undo",
-            accelerator="Ctrl+Z",
-            command=self.editor.undo
-        )
-        edit_menu.add_command(
-            label="Redo",
-            accelerator="Ctrl+Y",
-            command=self.editor.redo
-        )
+Features:
+• Syntax highlighting
+• Auto-save
+• Multiple themes
+• Search and replace
+• Spell checking
+• Line numbers
+• And much more!
 
-        edit_menu.add_separator()
+Built with ❤️ using Python and Tkinter
+"""
 
-        edit_menu.add_command(
-            label="Cut",
-            accelerator="Ctrl+X",
-            command=self.editor.cut
-        )
-        edit_menu.add_command(
-            label="Copy",
-            accelerator="Ctrl+C",
-            command=self.editor.copy
-        )
-        edit_menu.add_command(
-            label="Paste",
-            accelerator="Ctrl+V",
-            command=self.editor.paste
-        )
-        edit_menu.add_command(
-            label="Delete",
-            accelerator="Del",
-            command=self._delete_selection
-        )
+# Message shown by Tools > Word Count
+_STATS_FMT = "Words: %d\nCharacters: %d\nLines: %d"
+
+# Selection transforms that run entirely in Tcl, so the text never crosses into Python
+_TCL_PROCS = """
+namespace eval ::modernnotepad {
+    proc transform {w op} {
+        if {[catch {$w get sel.first sel.last} s]} return
+        $w delete sel.first sel.last
+        $w insert insert [string $op $s]
+    }
+}
+"""
 
-        edit_menu.add_separator()
 
-        edit_menu.add_command(
-            label="Select All",
-            accelerator="Ctrl+A",
-            command=self.editor.select_all
-        )
+def _tcl_quote(value):
+    """Quote a value as a single Tcl word"""
+    return re.sub(r'(\W)', r'\\\1', str(value))
 
-        edit_menu.add_separator()
 
-        edit_menu.add_command(
-            label="Insert Date/Time",
-            accelerator="F5",
-            command=self.editor.insert_datetime
-        )
+def _batch_add(menu, items):
+    """Add menu items with one Tcl eval instead of one call per item
 
-        # Text transformation submenu
-        transform_menu = tk.Menu(edit_menu, tearoff=0)
-        transform_menu.add_command(label="UPPERCASE", command=self._transform_uppercase)
-        transform_menu.add_command(label="lowercase", command=self._transform_lowercase)
-        transform_menu.add_command(label="Title Case", command=self._transform_title_case)
-        transform_menu.add_command(label="Reverse Text", command=self._transform_reverse)
-        edit_menu.add_cascade(label="Transform", menu=transform_menu)
+    Items are ('command' | 'checkbutton' | 'radiobutton', label, accelerator, callback),
+    ('cascade', label, submenu) or ('separator',).
+    """
+    script = []
+    for item in items:
+        kind = item[0]
+        if kind == 'separator':
+            script.append(f"{menu} add separator")
+            continue
 
-        self.menubar.add_cascade(label="Edit", menu=edit_menu)
+        if kind == 'cascade':
+            _, label, submenu = item
+            options = ['-label', label, '-menu', submenu]
+        else:
+            _, label, accelerator, callback = item
+            options = ['-label', label, '-command', menu.register(callback)]
+            if accelerator:
+                options += ['-accelerator', accelerator]
+        script.append(f"{menu} add {kind} " + ' '.join(_tcl_quote(option) for option in options))
 
-    def _create_view_menu(self):
-        """Create View menu"""
-        view_menu = tk.Menu(self.menubar, tearoff=0)
-
-        # Zoom submenu
-        zoom_menu = tk.Menu(view_menu, tearoff=0)
-        zoom_menu.add_command(
-            label="Zoom In",
-            accelerator="Ctrl++",
-            command=self.editor.zoom_in
-        )
-        zoom_menu.add_command(
-            label="Zoom Out",
-            accelerator="Ctrl+-",
-            command=self.editor.zoom_out
-        )
-        zoom_menu.add_command(
-            label="Reset Zoom",
-            accelerator="Ctrl+0",
-            command=self.editor.reset_zoom
-        )
-        view_menu.add_cascade(label="Zoom", menu=zoom_menu)
+    menu.tk.eval('\n'.join(script))
 
-        view_menu.add_separator()
 
-        # Toggle options
-        view_menu.add_checkbutton(
-            label="Show Line Numbers",
-            command=self._toggle_line_numbers
-        )
-        view_menu.add_checkbutton(
-            label="Word Wrap",
-            command=self._toggle_word_wrap
-        )
-        view_menu.add_checkbutton(
-            label="Show Status Bar",
-            command=self._toggle_status_bar
-        )
-        view_menu.add_checkbutton(
-            label="Highlight Current Line",
-            command=self._toggle_current_line_highlight
-        )
+class MenuBar:
+    """Menu bar for the editor window"""
 
-        view_menu.add_separator()
+    # One MenuBar per window; __weakref__ is needed for _RECENT_MENUS
+    __slots__ = (
+        'editor', 'menubar', 'recent_menu', '_recent_cache', '_open_recent_cmd', '_built',
+        '_shortcuts_win', '_find_next_fn', '_find_prev_fn', '_line_numbers_visible',
+        '_status_bar_visible', '__weakref__'
+    )
+
+    # Editor commands with keyboard shortcuts: accelerator label and bound key sequences
+    _ACCEL = {
+        # File operations
+        'new_file': ("Ctrl+N", ('<Control-n>',)),
+        'open_file': ("Ctrl+O", ('<Control-o>',)),
+        'save_file': ("Ctrl+S", ('<Control-s>',)),
+        'save_as_file': ("Ctrl+Shift+S", ('<Control-Shift-S>',)),
+        # Edit operations
+        'undo': ("Ctrl+Z", ('<Control-z>',)),
+        'redo': ("Ctrl+Y", ('<Control-y>',)),
+        'cut': ("Ctrl+X", ('<Control-x>',)),
+        'copy': ("Ctrl+C", ('<Control-c>',)),
+        'paste': ("Ctrl+V", ('<Control-v>',)),
+        'select_all': ("Ctrl+A", ('<Control-a>',)),
+        # Search operations
+        'show_find_dialog': ("Ctrl+F", ('<Control-f>',)),
+        'show_replace_dialog': ("Ctrl+H", ('<Control-h>',)),
+        'show_goto_line': ("Ctrl+G", ('<Control-g>',)),
+        # Zoom operations
+        'zoom_in': ("Ctrl++", ('<Control-plus>', '<Control-equal>')),
+        'zoom_out': ("Ctrl+-", ('<Control-minus>',)),
+        'reset_zoom': ("Ctrl+0", ('<Control-0>',)),
+        # Other
+        'insert_datetime': ("F5", ('<F5>',)),
+        'toggle_fullscreen': ("F11", ('<F11>',))
+    }
+
+    # Pack options used when showing the line numbers and status bar again
+    _LINE_NUMBERS_PACK = {'side': tk.LEFT, 'fill': tk.Y}
+    _STATUS_BAR_PACK = {'side': tk.BOTTOM, 'fill': tk.X}
 
-        # Theme submenu
-        theme_menu = tk.Menu(view_menu, tearoff=0)
-        theme_menu.add_radiobutton(
-            label="Light Theme",
-            command=lambda: self._change_theme('light')
-        )
-        theme_menu.add_radiobutton(
-            label="Dark Theme",
-            command=lambda: self._change_theme('dark')
-        )
-        theme_menu.add_radiobutton(
-            label="Monokai Theme",
-            command=lambda: self._change_theme('monokai')
-        )
-        theme_menu.add_radiobutton(
-            label="Solarized Theme",
-            command=lambda: self._change_theme('solarized')
-        )
-        view_menu.add_cascade(label="Themes", menu=theme_menu)
+    def __init__(self, editor):
+        self.editor = editor
+        self.menubar = tk.Menu(editor.window)
+        self.recent_menu = None
+        self._recent_cache = None
+        self._open_recent_cmd = editor.window.register(self._open_recent_by_index)
+        editor.window.tk.eval(_TCL_PROCS)
+        self._built = set()
+        self._shortcuts_win = None
+        self._find_next_fn = None
+        self._find_prev_fn = None
+        # The editor always packs both widgets when it builds its window
+        self._line_numbers_visible = True
+        self._status_bar_visible = True
+        self._create_menus()
+        self._bind_accelerators()
 
-        view_menu.add_separator()
+    def _create_menus(self):
+        """Create the top-level menus; their items are built when first opened"""
+        menubar = self.menubar
+        _batch_add(menubar, [
+            ('cascade', "File", self._lazy_menu(menubar, self._create_file_menu)),
+            ('cascade', "Edit", self._lazy_menu(menubar, self._create_edit_menu)),
+            ('cascade', "View", self._lazy_menu(menubar, self._create_view_menu)),
+            ('cascade', "Search", self._lazy_menu(menubar, self._create_search_menu)),
+            ('cascade', "Format", self._lazy_menu(menubar, self._create_format_menu)),
+            ('cascade', "Tools", self._lazy_menu(menubar, self._create_tools_menu)),
+            ('cascade', "Help", self._lazy_menu(menubar, self._create_help_menu)),
+        ])
+
+    def _bind_accelerators(self):
+        """Bind every shortcut in _ACCEL through one Tcl command that dispatches by name"""
+        run_command = self.editor.window.register(self._run_accelerator)
+        for name, (_, sequences) in self._ACCEL.items():
+            for sequence in sequences:
+                self.editor.window.bind(sequence, f"{run_command} {name}")
+
+    def _run_accelerator(self, name):
+        """Run the editor command bound to a keyboard shortcut"""
+        getattr(self.editor, name)()
+
+    def _lazy_menu(self, parent, builder):
+        """Create an empty menu that builder fills in the first time it is posted"""
+        menu = tk.Menu(parent, tearoff=0)
+        menu.configure(postcommand=lambda: self._build_once(menu, builder))
+        return menu
+
+    def _build_once(self, menu, builder):
+        """Run a menu builder unless the menu has already been populated"""
+        if str(menu) in self._built:
+            return
+        self._built.add(str(menu))
+        builder(menu)
+
+    def _create_file_menu(self, file_menu):
+        """Create File menu"""
+        editor = self.editor
+        accel = self._ACCEL
 
-        view_menu.add_command(
-            label="Full Screen",
-            accelerator="F11",
-            command=self.editor.toggle_fullscreen
-        )
+        # Recent files submenu
+        self.recent_menu = tk.Menu(file_menu, tearoff=0, postcommand=self._update_recent_files)
+        _RECENT_MENUS.add(self)
+
+        _batch_add(file_menu, [
+            ('command', "New", accel['new_file'][0], editor.new_file),
+            ('command', "New Window", "Ctrl+Shift+N", editor.app.new_window),
+            ('separator',),
+            ('command', "Open...", accel['open_file'][0], editor.open_file),
+            ('cascade', "Recent Files", self.recent_menu),
+            ('separator',),
+            ('command', "Save", accel['save_file'][0], editor.save_file),
+            ('command', "Save As...", accel['save_as_file'][0], editor.save_as_file),
+            ('command', "Save All", None, self._save_all_files),
+            ('separator',),
+            ('cascade', "Import/Export", self._lazy_menu(file_menu, self._create_import_export_menu)),
+            ('separator',),
+            ('command', "Page Setup...", None, partial(self._stub, "Page setup coming soon!")),
+            ('command', "Print...", "Ctrl+P", partial(self._stub, "Print functionality coming soon!")),
+            ('separator',),
+            ('command', "Close", "Ctrl+W", editor.close),
+            ('command', "Exit", "Alt+F4", editor.app.quit),
+        ])
+        self._update_recent_files()
 
-        self.menubar.add_cascade(label="View", menu=view_menu)
+    def _create_import_export_menu(self, import_export_menu):
+        """Create Import/Export submenu"""
+        _batch_add(import_export_menu, [
+            ('command', "Import from Word Document...", None,
+             partial(self._stub, "Import from Word document coming soon!")),
+            ('command', "Export to PDF...", None, partial(self._stub, "Export to PDF coming soon!")),
+            ('command', "Export to HTML...", None, partial(self._stub, "Export to HTML coming soon!")),
+        ])
 
-    def _create_search_menu(self):
+    def _create_edit_menu(self, edit_menu):
+        """Create Edit menu"""
+        editor = self.editor
+        accel = self._ACCEL
+        _batch_add(edit_menu, [
+            ('command', "Undo", accel['undo'][0], editor.undo),
+            ('command', "Redo", accel['redo'][0], editor.redo),
+            ('separator',),
+            ('command', "Cut", accel['cut'][0], editor.cut),
+            ('command', "Copy", accel['copy'][0], editor.copy),
+            ('command', "Paste", accel['paste'][0], editor.paste),
+            ('command', "Delete", "Del", self._delete_selection),
+            ('separator',),
+            ('command', "Select All", accel['select_all'][0], editor.select_all),
+            ('separator',),
+            ('command', "Insert Date/Time", accel['insert_datetime'][0], editor.insert_datetime),
+            # Text transformation submenu
+            ('cascade', "Transform", self._lazy_menu(edit_menu, self._create_transform_menu)),
+        ])
+
+    def _create_transform_menu(self, transform_menu):
+        """Create Transform submenu"""
+        _batch_add(transform_menu, [
+            ('command', "UPPERCASE", None, partial(self._tcl_transform, 'toupper')),
+            ('command', "lowercase", None, partial(self._tcl_transform, 'tolower')),
+            ('command', "Title Case", None, partial(self._transform, str.title)),
+            ('command', "Reverse Text", None, partial(self._tcl_transform, 'reverse')),
+        ])
+
+    def _create_view_menu(self, view_menu):
+        """Create View menu"""
+        _batch_add(view_menu, [
+            ('cascade', "Zoom", self._lazy_menu(view_menu, self._create_zoom_menu)),
+            ('separator',),
+            # Toggle options
+            ('checkbutton', "Show Line Numbers", None, self._toggle_line_numbers),
+            ('checkbutton', "Word Wrap", None, self._toggle_word_wrap),
+            ('checkbutton', "Show Status Bar", None, self._toggle_status_bar),
+            ('checkbutton', "Highlight Current Line", None, self._toggle_current_line_highlight),
+            ('separator',),
+            ('cascade', "Themes", self._lazy_menu(view_menu, self._create_theme_menu)),
+            ('separator',),
+            ('command', "Full Screen", self._ACCEL['toggle_fullscreen'][0], self.editor.toggle_fullscreen),
+        ])
+
+    def _create_zoom_menu(self, zoom_menu):
+        """Create Zoom submenu"""
+        editor = self.editor
+        accel = self._ACCEL
+        _batch_add(zoom_menu, [
+            ('command', "Zoom In", accel['zoom_in'][0], editor.zoom_in),
+            ('command', "Zoom Out", accel['zoom_out'][0], editor.zoom_out),
+            ('command', "Reset Zoom", accel['reset_zoom'][0], editor.reset_zoom),
+        ])
+
+    def _create_theme_menu(self, theme_menu):
+        """Create Themes submenu"""
+        _batch_add(theme_menu, [
+            ('radiobutton', "Light Theme", None, partial(self._change_theme, 'light')),
+            ('radiobutton', "Dark Theme", None, partial(self._change_theme, 'dark')),
+            ('radiobutton', "Monokai Theme", None, partial(self._change_theme, 'monokai')),
+            ('radiobutton', "Solarized Theme", None, partial(self._change_theme, 'solarized')),
+        ])
+
+    def _create_search_menu(self, search_menu):
         """Create Search menu"""
-        search_menu = tk.Menu(self.menubar, tearoff=0)
-
-        search_menu.add_command(
-            label="Find...",
-            accelerator="Ctrl+F",
-            command=self.editor.show_find_dialog
-        )
-        search_menu.add_command(
-            label="Find Next",
-            accelerator="F3",
-            command=self._find_next
-        )
-        search_menu.add_command(
-            label="Find Previous",
-            accelerator="Shift+F3",
-            command=self._find_previous
-        )
-
-        search_menu.add_separator()
-
-        search_menu.add_command(
-            label="Replace...",
-            accelerator="Ctrl+H",
-            command=self.editor.show_replace_dialog
-        )
-
-        search_menu.add_separator()
-
-        search_menu.add_command(
-            label="Go to Line...",
-            accelerator="Ctrl+G",
-            command=self.editor.show_goto_line
-        )
-
-        search_menu.add_separator()
-
-        search_menu.add_command(
-            label="Find in Files...",
-            accelerator="Ctrl+Shift+F",
-            command=self._find_in_files
-        )
-
-        self.menubar.add_cascade(label="Search", menu=search_menu)
-
-    def _create_format_menu(self):
+        editor = self.editor
+        accel = self._ACCEL
+        self.rebind_search()
+
+        _batch_add(search_menu, [
+            ('command', "Find...", accel['show_find_dialog'][0], editor.show_find_dialog),
+            ('command', "Find Next", "F3", self._find_next_fn),
+            ('command', "Find Previous", "Shift+F3", self._find_prev_fn),
+            ('separator',),
+            ('command', "Replace...", accel['show_replace_dialog'][0], editor.show_replace_dialog),
+            ('separator',),
+            ('command', "Go to Line...", accel['show_goto_line'][0], editor.show_goto_line),
+            ('separator',),
+            ('command', "Find in Files...", "Ctrl+Shift+F",
+             partial(self._stub, "Find in Files feature coming soon!")),
+        ])
+
+    def _create_format_menu(self, format_menu):
         """Create Format menu"""
-        format_menu = tk.Menu(self.menubar, tearoff=0)
-
-        format_menu.add_command(
-            label="Font...",
-            command=self._change_font
-        )
-        format_menu.add_command(
-            label="Text Color...",
-            command=self._change_text_color
-        )
-        format_menu.add_command(
-            label="Background Color...",
-            command=self._change_background_color
-        )
-
-        format_menu.add_separator()
-
-        # Text style submenu
-        style_menu = tk.Menu(format_menu, tearoff=0)
-        style_menu.add_checkbutton(
-            label="Bold",
-            accelerator="Ctrl+B",
-            command=self._toggle_bold
-        )
-        style_menu.add_checkbutton(
-            label="Italic",
-            accelerator="Ctrl+I",
-            command=self._toggle_italic
-        )
-        style_menu.add_checkbutton(
-            label="Underline",
-            accelerator="Ctrl+U",
-            command=self._toggle_underline
-        )
-        format_menu.add_cascade(label="Text Style", menu=style_menu)
-
-        format_menu.add_separator()
-
-        # Indentation submenu
-        indent_menu = tk.Menu(format_menu, tearoff=0)
-        indent_menu.add_command(
-            label="Increase Indent",
-            accelerator="Tab",
-            command=self._increase_indent
-        )
-        indent_menu.add_command(
-            label="Decrease Indent",
-            accelerator="Shift+Tab",
-            command=self._decrease_indent
-        )
-        indent_menu.add_command(
-            label="Auto Indent",
-            command=self._auto_indent
-        )
-        format_menu.add_cascade(label="Indentation", menu=indent_menu)
-
-        self.menubar.add_cascade(label="Format", menu=format_menu)
-
-    def _create_tools_menu(self):
+        _batch_add(format_menu, [
+            ('command', "Font...", None, self._change_font),
+            ('command', "Text Color...", None, self._change_text_color),
+            ('command', "Background Color...", None, self._change_background_color),
+            ('separator',),
+            ('cascade', "Text Style", self._lazy_menu(format_menu, self._create_style_menu)),
+            ('separator',),
+            ('cascade', "Indentation", self._lazy_menu(format_menu, self._create_indent_menu)),
+        ])
+
+    def _create_style_menu(self, style_menu):
+        """Create Text Style submenu"""
+        _batch_add(style_menu, [
+            ('checkbutton', "Bold", "Ctrl+B", self._toggle_bold),
+            ('checkbutton', "Italic", "Ctrl+I", self._toggle_italic),
+            ('checkbutton', "Underline", "Ctrl+U", self._toggle_underline),
+        ])
+
+    def _create_indent_menu(self, indent_menu):
+        """Create Indentation submenu"""
+        _batch_add(indent_menu, [
+            ('command', "Increase Indent", "Tab", self._increase_indent),
+            ('command', "Decrease Indent", "Shift+Tab", self._decrease_indent),
+            ('command', "Auto Indent", None, partial(self._stub, "Auto-indent feature coming soon!")),
+        ])
+
+    def _create_tools_menu(self, tools_menu):
         """Create Tools menu"""
-        tools_menu = tk.Menu(self.menubar, tearoff=0)
-
-        tools_menu.add_command(
-            label="Spell Check",
-            accelerator="F7",
-            command=self._run_spell_check
-        )
-        tools_menu.add_command(
-            label="Word Count",
-            command=self._show_word_count
-        )
-
-        tools_menu.add_separator()
-
-        tools_menu.add_command(
-            label="Sort Lines",
-            command=self._sort_lines
-        )
-        tools_menu.add_command(
-            label="Remove Duplicates",
-            command=self._remove_duplicates
-        )
-        tools_menu.add_command(
-            label="Line Endings...",
-            command=self._line_endings_dialog
-        )
-
-        tools_menu.add_separator()
-
-        # Encoding submenu
-        encoding_menu = tk.Menu(tools_menu, tearoff=0)
-        encoding_menu.add_radiobutton(label="UTF-8", command=lambda: self._set_encoding('utf-8'))
-        encoding_menu.add_radiobutton(label="UTF-16", command=lambda: self._set_encoding('utf-16'))
-        encoding_menu.add_radiobutton(label="ASCII", command=lambda: self._set_encoding('ascii'))
-        tools_menu.add_cascade(label="Encoding", menu=encoding_menu)
-
-        tools_menu.add_separator()
-
-        # Auto-save options
-        autosave_menu = tk.Menu(tools_menu, tearoff=0)
-        autosave_menu.add_checkbutton(
-            label="Enable Auto-save",
-            command=self._toggle_autosave
-        )
-        autosave_menu.add_command(
-            label="Auto-save Settings...",
-            command=self._autosave_settings
-        )
-        tools_menu.add_cascade(label="Auto-save", menu=autosave_menu)
-
-        tools_menu.add_separator()
-
-        tools_menu.add_command(
-            label="Options...",
-            command=self.editor.show_settings
-        )
-
-        self.menubar.add_cascade(label="Tools", menu=tools_menu)
-
-    def _create_help_menu(self):
+        _batch_add(tools_menu, [
+            ('command', "Spell Check", "F7", self._run_spell_check),
+            ('command', "Word Count", None, self._show_word_count),
+            ('separator',),
+            ('command', "Sort Lines", None, self._sort_lines),
+            ('command', "Sort Lines (Ignore Case)", None, partial(self._sort_lines, str.casefold)),
+            ('command', "Remove Duplicates", None, self._remove_duplicates),
+            ('command', "Line Endings...", None, partial(self._stub, "Line endings management coming soon!")),
+            ('separator',),
+            ('cascade', "Encoding", self._lazy_menu(tools_menu, self._create_encoding_menu)),
+            ('separator',),
+            ('cascade', "Auto-save", self._lazy_menu(tools_menu, self._create_autosave_menu)),
+            ('separator',),
+            ('command', "Options...", None, self.editor.show_settings),
+        ])
+
+    def _create_encoding_menu(self, encoding_menu):
+        """Create Encoding submenu"""
+        _batch_add(encoding_menu, [
+            ('radiobutton', "UTF-8", None, partial(self._set_encoding, 'utf-8')),
+            ('radiobutton', "UTF-16", None, partial(self._set_encoding, 'utf-16')),
+            ('radiobutton', "ASCII", None, partial(self._set_encoding, 'ascii')),
+        ])
+
+    def _create_autosave_menu(self, autosave_menu):
+        """Create Auto-save submenu"""
+        _batch_add(autosave_menu, [
+            ('checkbutton', "Enable Auto-save", None, self._toggle_autosave),
+            ('command', "Auto-save Settings...", None, partial(self._stub, "Auto-save settings coming soon!")),
+        ])
+
+    def _create_help_menu(self, help_menu):
         """Create Help menu"""
-        help_menu = tk.Menu(self.menubar, tearoff=0)
-
-        help_menu.add_command(
-            label="Keyboard Shortcuts",
-            accelerator="F1",
-            command=self._show_shortcuts
-        )
-        help_menu.add_command(
-            label="User Manual",
-            command=self._show_manual
-        )
-
-        help_menu.add_separator()
-
-        help_menu.add_command(
-            label="Check for Updates",
-            command=self._check_updates
-        )
-        help_menu.add_command(
-            label="Report Bug",
-            command=self._report_bug
-        )
-        help_menu.add_command(
-            label="Send Feedback",
-            command=self._send_feedback
-        )
-
-        help_menu.add_separator()
-
-        help_menu.add_command(
-            label="About Modern Notepad",
-            command=self._show_about
-        )
-
-        self.menubar.add_cascade(label="Help", menu=help_menu)
+        _batch_add(help_menu, [
+            ('command', "Keyboard Shortcuts", "F1", self._show_shortcuts),
+            ('command', "User Manual", None, partial(self._stub, "User manual coming soon!")),
+            ('separator',),
+            ('command', "Check for Updates", None, self._check_updates),
+            ('command', "Report Bug", None, self._report_bug),
+            ('command', "Send Feedback", None, self._send_feedback),
+            ('separator',),
+            ('command', "About Modern Notepad", None, self._show_about),
+        ])
 
     # Menu action implementations
     def _update_recent_files(self):
         """Update recent files menu"""
-        # Clear existing items
+        if self.recent_menu is None:
+            return  # File menu has not been built yet
+
+        recent_files = tuple(self.editor.config.get('recent_files', [])[:10])  # Show last 10 files
+        existing = _RECENT_CACHE.get(recent_files)
+        if existing is not None:
+            self._rebuild_recent(existing)
+            return
+
+        # Check which files still exist off the UI thread
+        future = self.editor._io_executor.submit(self._filter_recent_files, recent_files)
+        self.editor.call_when_done(future, self._on_recent_filtered, recent_files)
+
+    @staticmethod
+    def _filter_recent_files(recent_files):
+        """Drop recent files that no longer exist (runs in a worker thread)"""
+        return [file_path for file_path in recent_files if os.path.exists(file_path)]
+
+    def _on_recent_filtered(self, recent_files, future):
+        """Cache a checked recent files list and publish it (runs on the Tk thread)"""
+        existing = future.result()
+        _RECENT_CACHE.clear()
+        _RECENT_CACHE[recent_files] = existing
+        self._publish_recent(existing)
+
+    @staticmethod
+    def _publish_recent(existing):
+        """Show a newly checked recent files list in every window"""
+        for menu_bar in list(_RECENT_MENUS):
+            try:
+                menu_bar._rebuild_recent(existing)
+            except tk.TclError:
+                _RECENT_MENUS.discard(menu_bar)  # Window was closed
+
+    def _rebuild_recent(self, recent_files):
+        """Fill the recent files menu, relabelling entries in place when the count is unchanged"""
+        if recent_files is self._recent_cache:
+            return
+
+        if self._recent_cache is not None and len(recent_files) == len(self._recent_cache):
+            for index, file_path in enumerate(recent_files):
+                self.recent_menu.entryconfigure(index, label=os.path.basename(file_path))
+            self._recent_cache = recent_files
+            return
+
+        self._recent_cache = recent_files
         self.recent_menu.delete(0, tk.END)
 
-        # Get recent files from config
-        recent_files = self.editor.config.get('recent_files', [])
-
         if recent_files:
-            for file_path in recent_files[:10]:  # Show last 10 files
-                if os.path.exists(file_path):
-                    filename = os.path.basename(file_path)
-                    self.recent_menu.add_command(
-                        label=filename,
-                        command=lambda f=file_path: self.editor.file_ops.open_file(f)
-                    )
+            # Every entry shares one Tcl command that dispatches on its index
+            for index, file_path in enumerate(recent_files):
+                self.recent_menu.add_command(
+                    label=os.path.basename(file_path),
+                    command=f"{self._open_recent_cmd} {index}"
+                )
 
             self.recent_menu.add_separator()
             self.recent_menu.add_command(
@@ -476,16 +482,66 @@ class MenuBar:
         else:
             self.recent_menu.add_command(label="(No recent files)", state='disabled')
 
+    def _open_recent_by_index(self, index):
+        """Open the recent file shown at the given menu index"""
+        self.editor.file_ops.open_file(self._recent_cache[int(index)])
+
     def _clear_recent_files(self):
         """Clear recent files list"""
         self.editor.config.set('recent_files', [])
         self._update_recent_files()
 
     def _save_all_files(self):
-        """Save all open files"""
-        for editor_window in self.editor.app.editor_windows:
-            if editor_window.is_modified:
+        """Save all open files, writing them to disk in parallel"""
+        modified = [w for w in self.editor.app.editor_windows if w.is_modified]
+        saved = [w for w in modified if w.current_file]
+        if len(saved) < 2:
+            for editor_window in modified:
                 editor_window.save_file()
+            return
+
+        # Untitled documents need a Save As dialog on the Tk thread
+        for editor_window in modified:
+            if not editor_window.current_file:
+                editor_window.save_file()
+
+        # Snapshot text on the Tk thread; only the disk writes run in the pool
+        executor = ThreadPoolExecutor(max_workers=min(8, len(saved)))
+        futures = {}
+        for editor_window in saved:
+            content = editor_window.text_widget.get('1.0', 'end-1c')
+            editor_window.set_modified(False)
+            future = executor.submit(
+                editor_window.file_ops.write_to_disk, editor_window.current_file, content
+            )
+            futures[future] = (editor_window, editor_window.current_file)
+        executor.shutdown(wait=False)
+
+        self._wait_for_saves(futures)
+
+    def _wait_for_saves(self, futures):
+        """Collect the results of a Save All on the Tk thread once every write has finished"""
+        for future in futures:
+            if not future.done():
+                self.editor.call_when_done(future, lambda done: self._wait_for_saves(futures))
+                return
+
+        results = [(*futures[future], future.exception()) for future in futures]
+        self._on_saves_done(results)
+
+    def _on_saves_done(self, results):
+        """Log a finished Save All and report any files that failed in one dialog"""
+        failed = []
+        for editor_window, file_path, error in results:
+            logger = editor_window.app.logger
+            logger.log_file_operation("Save file", file_path, error is None)
+            if error is not None:
+                editor_window.set_modified(True)
+                logger.log_error_with_context(str(error), f"Saving file: {file_path}")
+                failed.append(f"{os.path.basename(file_path)}: {error}")
+
+        if failed:
+            messagebox.showerror("Save All", "Some files could not be saved:\n\n" + "\n".join(failed))
 
     def _delete_selection(self):
         """Delete selected text"""
@@ -495,48 +551,33 @@ class MenuBar:
             # No selection, delete character at cursor
             self.editor.text_widget.delete(tk.INSERT)
 
-    def _transform_uppercase(self):
-        """Transform selected text to uppercase"""
-        try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, selected_text.upper())
-        except tk.TclError:
-            pass
+    def _tcl_transform(self, op):
+        """Replace the selected text with Tcl's [string op] of it"""
+        self.editor.window.tk.call('::modernnotepad::transform', self.editor.text_widget, op)
 
-    def _transform_lowercase(self):
-        """Transform selected text to lowercase"""
+    def _transform(self, fn):
+        """Replace the selected text with fn(selected_text)"""
+        text_widget = self.editor.text_widget
         try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, selected_text.lower())
-        except tk.TclError:
-            pass
-
-    def _transform_title_case(self):
-        """Transform selected text to title case"""
-        try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, selected_text.title())
-        except tk.TclError:
-            pass
-
-    def _transform_reverse(self):
-        """Reverse selected text"""
-        try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, selected_text[::-1])
+            selected_text = text_widget.get('sel.first', 'sel.last')
+            text_widget.delete('sel.first', 'sel.last')
+            text_widget.insert(tk.INSERT, fn(selected_text))
         except tk.TclError:
             pass
 
     def _toggle_line_numbers(self):
         """Toggle line numbers visibility"""
-        if self.editor.line_numbers.winfo_viewable():
-            self.editor.line_numbers.pack_forget()
+        self.set_line_numbers_visible(not self._line_numbers_visible)
+
+    def set_line_numbers_visible(self, visible):
+        """Show or hide the line numbers"""
+        if visible == self._line_numbers_visible:
+            return
+        if visible:
+            self.editor.line_numbers.pack(**self._LINE_NUMBERS_PACK)
         else:
-            self.editor.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
+            self.editor.line_numbers.pack_forget()
+        self._line_numbers_visible = visible
 
     def _toggle_word_wrap(self):
         """Toggle word wrap"""
@@ -546,10 +587,17 @@ class MenuBar:
 
     def _toggle_status_bar(self):
         """Toggle status bar visibility"""
-        if self.editor.status_bar.winfo_viewable():
-            self.editor.status_bar.pack_forget()
+        self.set_status_bar_visible(not self._status_bar_visible)
+
+    def set_status_bar_visible(self, visible):
+        """Show or hide the status bar"""
+        if visible == self._status_bar_visible:
+            return
+        if visible:
+            self.editor.status_bar.pack(**self._STATUS_BAR_PACK)
         else:
-            self.editor.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.editor.status_bar.pack_forget()
+        self._status_bar_visible = visible
 
     def _toggle_current_line_highlight(self):
         """Toggle current line highlighting"""
@@ -562,24 +610,14 @@ class MenuBar:
         self.editor._apply_theme()
         self.editor.config.set('theme', theme_name)
 
-    def _find_next(self):
-        """Find next occurrence"""
-        if hasattr(self.editor.search_replace, 'find_next'):
-            self.editor.search_replace.find_next()
-
-    def _find_previous(self):
-        """Find previous occurrence"""
-        if hasattr(self.editor.search_replace, 'find_previous'):
-            self.editor.search_replace.find_previous()
-
-    def _find_in_files(self):
-        """Find in multiple files"""
-        messagebox.showinfo("Feature", "Find in Files feature coming soon!")
+    def rebind_search(self):
+        """Resolve the find next/previous callables from the editor's search module"""
+        search_replace = getattr(self.editor, 'search_replace', None)
+        self._find_next_fn = getattr(search_replace, 'find_next', None) or (lambda: None)
+        self._find_prev_fn = getattr(search_replace, 'find_previous', None) or (lambda: None)
 
     def _change_font(self):
         """Change font"""
-        from tkinter.simpledialog import askstring
-
         # Simple font dialog - in a real implementation, you'd use a proper font dialog
         new_font = askstring("Font", f"Current font: {self.editor.font_family}")
         if new_font:
@@ -589,14 +627,12 @@ class MenuBar:
 
     def _change_text_color(self):
         """Change text color"""
-        from tkinter import colorchooser
         color = colorchooser.askcolor(title="Choose text color")
         if color[1]:
             self.editor.text_widget.config(fg=color[1])
 
     def _change_background_color(self):
         """Change background color"""
-        from tkinter import colorchooser
         color = colorchooser.askcolor(title="Choose background color")
         if color[1]:
             self.editor.text_widget.config(bg=color[1])
@@ -618,46 +654,41 @@ class MenuBar:
 
     def _increase_indent(self):
         """Increase indentation"""
-        try:
-            # Get selected lines or current line
-            sel_start = self.editor.text_widget.index('sel.first')
-            sel_end = self.editor.text_widget.index('sel.last')
-        except tk.TclError:
-            # No selection, use current line
-            sel_start = self.editor.text_widget.index(f"{tk.INSERT} linestart")
-            sel_end = self.editor.text_widget.index(f"{tk.INSERT} lineend")
-
-        # Add indentation to each line
-        start_line = int(sel_start.split('.')[0])
-        end_line = int(sel_end.split('.')[0])
-
-        for line_num in range(start_line, end_line + 1):
-            line_start = f"{line_num}.0"
-            self.editor.text_widget.insert(line_start, "    ")  # 4 spaces
+        # Prefix every line with 4 spaces
+        self._reindent(lambda block: '\n'.join("    " + line for line in block.split('\n')))
 
     def _decrease_indent(self):
         """Decrease indentation"""
+        self._reindent(lambda block: _DEDENT_RE.sub('', block))
+
+    def _reindent(self, fn):
+        """Rewrite the selected lines (or the current line) as a single edit"""
+        text_widget = self.editor.text_widget
         try:
-            sel_start = self.editor.text_widget.index('sel.first')
-            sel_end = self.editor.text_widget.index('sel.last')
+            # Get selected lines or current line
+            sel_start = text_widget.index('sel.first')
+            sel_end = text_widget.index('sel.last')
+            has_selection = True
         except tk.TclError:
-            sel_start = self.editor.text_widget.index(f"{tk.INSERT} linestart")
-            sel_end = self.editor.text_widget.index(f"{tk.INSERT} lineend")
+            # No selection, use current line
+            sel_start = text_widget.index(f"{tk.INSERT} linestart")
+            sel_end = text_widget.index(f"{tk.INSERT} lineend")
+            has_selection = False
 
-        start_line = int(sel_start.split('.')[0])
-        end_line = int(sel_end.split('.')[0])
+        start = f"{sel_start.split('.')[0]}.0"
+        end = f"{sel_end.split('.')[0]}.end"
+        block = text_widget.get(start, end)
+        new_block = fn(block)
+        if new_block == block:
+            return
 
-        for line_num in range(start_line, end_line + 1):
-            line_start = f"{line_num}.0"
-            line_text = self.editor.text_widget.get(line_start, f"{line_num}.end")
-            if line_text.startswith("    "):
-                self.editor.text_widget.delete(line_start, f"{line_num}.4")
-            elif line_text.startswith("\t"):
-                self.editor.text_widget.delete(line_start, f"{line_num}.1")
+        text_widget.edit_separator()
+        text_widget.delete(start, end)
+        text_widget.insert(start, new_block)
+        text_widget.edit_separator()
 
-    def _auto_indent(self):
-        """Auto-indent selected text"""
-        messagebox.showinfo("Feature", "Auto-indent feature coming soon!")
+        if has_selection:
+            text_widget.tag_add('sel', start, f"{sel_end.split('.')[0]}.end")
 
     def _run_spell_check(self):
         """Run spell check"""
@@ -668,46 +699,41 @@ class MenuBar:
 
     def _show_word_count(self):
         """Show word count dialog"""
-        content = self.editor.text_widget.get('1.0', 'end-1c')
-        words = len(content.split()) if content.strip() else 0
-        chars = len(content)
-        lines = int(self.editor.text_widget.index('end-1c').split('.')[0])
-
-        messagebox.showinfo(
-            "Document Statistics",
-            f"Words: {words}\nCharacters: {chars}\nLines: {lines}"
-        )
+        words, chars, lines = self.editor.get_document_stats()
 
-    def _sort_lines(self):
+        messagebox.showinfo("Document Statistics", _STATS_FMT % (words, chars, lines))
+
+    def _sort_lines(self, key=None):
         """Sort selected lines"""
+        text_widget = self.editor.text_widget
         try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            lines = selected_text.split('\n')
-            sorted_lines = '\n'.join(sorted(lines))
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, sorted_lines)
+            start = text_widget.index('sel.first')
+            end = text_widget.index('sel.last')
+            lines = text_widget.get(start, end).split('\n')
+            lines.sort(key=key)
+            text_widget.edit_separator()
+            text_widget.delete(start, end)
+            text_widget.insert(start, '\n'.join(lines))
+            text_widget.edit_separator()
         except tk.TclError:
             messagebox.showwarning("Sort Lines", "Please select text to sort")
 
     def _remove_duplicates(self):
         """Remove duplicate lines"""
+        text_widget = self.editor.text_widget
         try:
-            selected_text = self.editor.text_widget.get('sel.first', 'sel.last')
-            lines = selected_text.split('\n')
-            unique_lines = []
-            for line in lines:
-                if line not in unique_lines:
-                    unique_lines.append(line)
-            result = '\n'.join(unique_lines)
-            self.editor.text_widget.delete('sel.first', 'sel.last')
-            self.editor.text_widget.insert(tk.INSERT, result)
+            start = text_widget.index('sel.first')
+            end = text_widget.index('sel.last')
+            selected_text = text_widget.get(start, end)
+            # dict keeps the first occurrence of each line, in order
+            result = '\n'.join(dict.fromkeys(selected_text.split('\n')))
+            text_widget.edit_separator()
+            text_widget.delete(start, end)
+            text_widget.insert(start, result)
+            text_widget.edit_separator()
         except tk.TclError:
             messagebox.showwarning("Remove Duplicates", "Please select text to process")
 
-    def _line_endings_dialog(self):
-        """Show line endings dialog"""
-        messagebox.showinfo("Feature", "Line endings management coming soon!")
-
     def _set_encoding(self, encoding):
         """Set file encoding"""
         self.editor.file_encoding = encoding
@@ -722,95 +748,39 @@ class MenuBar:
             else:
                 self.editor.autosave.start()
 
-    def _autosave_settings(self):
-        """Show auto-save settings"""
-        messagebox.showinfo("Feature", "Auto-save settings coming soon!")
-
-    # Import/Export functions
-    def _import_docx(self):
-        """Import from Word document"""
-        messagebox.showinfo("Feature", "Import from Word document coming soon!")
-
-    def _export_pdf(self):
-        """Export to PDF"""
-        messagebox.showinfo("Feature", "Export to PDF coming soon!")
-
-    def _export_html(self):
-        """Export to HTML"""
-        messagebox.showinfo("Feature", "Export to HTML coming soon!")
-
-    def _page_setup(self):
-        """Show page setup dialog"""
-        messagebox.showinfo("Feature", "Page setup coming soon!")
-
-    def _print_file(self):
-        """Print file"""
-        messagebox.showinfo("Feature", "Print functionality coming soon!")
+    def _stub(self, message):
+        """Announce a feature that is not implemented yet"""
+        messagebox.showinfo("Feature", message)
 
     # Help functions
     def _show_shortcuts(self):
         """Show keyboard shortcuts"""
-        shortcuts_text = """
-Keyboard Shortcuts:
-
-File Operations:
-Ctrl+N - New file
-Ctrl+O - Open file
-Ctrl+S - Save file
-Ctrl+Shift+S - Save as
-Ctrl+W - Close file
-Alt+F4 - Exit
-
-Edit Operations:
-Ctrl+Z - Undo
-Ctrl+Y - Redo
-Ctrl+X - Cut
-Ctrl+C - Copy
-Ctrl+V - Paste
-Ctrl+A - Select all
-Del - Delete
+        # Reuse the window built on the first call; closing only hides it
+        if self._shortcuts_win is not None:
+            self._shortcuts_win.deiconify()
+            self._shortcuts_win.lift()
+            return
 
-Search Operations:
-Ctrl+F - Find
-Ctrl+H - Replace
-Ctrl+G - Go to line
-F3 - Find next
-Shift+F3 - Find previous
-
-View Operations:
-Ctrl++ - Zoom in
-Ctrl+- - Zoom out
-Ctrl+0 - Reset zoom
-F11 - Full screen
-
-Other:
-F5 - Insert date/time
-F7 - Spell check
-F1 - Show this help
-        """
-
-        # Create a new window to show shortcuts
         shortcuts_window = tk.Toplevel(self.editor.window)
         shortcuts_window.title("Keyboard Shortcuts")
         shortcuts_window.geometry("400x600")
         shortcuts_window.resizable(False, False)
+        shortcuts_window.protocol("WM_DELETE_WINDOW", shortcuts_window.withdraw)
 
         text_widget = tk.Text(shortcuts_window, wrap=tk.WORD, padx=10, pady=10)
         text_widget.pack(fill=tk.BOTH, expand=True)
-        text_widget.insert('1.0', shortcuts_text)
+        text_widget.insert('1.0', _SHORTCUTS_TEXT)
         text_widget.config(state='disabled')
 
         # Add close button
         close_button = tk.Button(
             shortcuts_window,
             text="Close",
-            command=shortcuts_window.destroy
+            command=shortcuts_window.withdraw
         )
         close_button.pack(pady=10)
 
-    def _show_manual(self):
-        """Show user manual"""
-        messagebox.showinfo("Feature", "User manual coming soon!")
+        self._shortcuts_win = shortcuts_window
 
     def _check_updates(self):
         """Check for updates"""
@@ -818,6 +788,7 @@ F1 - Show this help
 
     def _report_bug(self):
         """Report a bug"""
+        import webbrowser
         webbrowser.open("https://github.com/yourrepository/issues")
 
     def _send_feedback(self):
@@ -826,20 +797,4 @@ F1 - Show this help
 
     def _show_about(self):
         """Show about dialog"""
-        about_text = """
-Modern Notepad v1.0
-
-A full-featured text editor built with Python and Tkinter.
-
-Features:
-• Syntax highlighting
-• Auto-save
-• Multiple themes
-• Search and replace
-• Spell checking
-• Line numbers
-• And much more!
-
-Built with ❤️ using Python and Tkinter
-        """
-        messagebox.showinfo("About Modern Notepad", about_text)
+        messagebox.showinfo("About Modern Notepad", _ABOUT_TEXT)
@@ -2,11 +2,124 @@
 Settings Window - Application settings and preferences
 """
 
-import json
+import functools
+import os
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk, messagebox, filedialog, font
 
+from utils.json_io import dumps, loads
+
+# Initial size of the settings window
+WINDOW_WIDTH = 600
+WINDOW_HEIGHT = 500
+
+# Delay before the font preview follows edits in the font fields
+PREVIEW_DELAY_MS = 60
+
+# Tk variable type for each setting shown in the window
+_SETTING_TYPES = {
+    # General
+    'autosave_enabled': tk.BooleanVar,
+    'autosave_interval': tk.IntVar,
+    'backup_files': tk.BooleanVar,
+    'restore_session': tk.BooleanVar,
+    'max_recent_files': tk.IntVar,
+    'confirm_exit': tk.BooleanVar,
+    'encoding': tk.StringVar,
+
+    # Editor
+    'word_wrap': tk.BooleanVar,
+    'line_numbers': tk.BooleanVar,
+    'highlight_current_line': tk.BooleanVar,
+    'show_whitespace': tk.BooleanVar,
+    'tab_size': tk.IntVar,
+    'auto_indent': tk.BooleanVar,
+    'smart_indent': tk.BooleanVar,
+    'syntax_highlighting': tk.BooleanVar,
+    'spell_check_enabled': tk.BooleanVar,
+    'spell_language': tk.StringVar,
+
+    # Appearance
+    'theme': tk.StringVar,
+    'font_family': tk.StringVar,
+    'font_size': tk.IntVar,
+    'status_bar': tk.BooleanVar,
+    'show_line_endings': tk.BooleanVar,
+
+    # Advanced
+    'large_file_threshold': tk.IntVar,
+    'enable_logging': tk.BooleanVar,
+    'log_level': tk.StringVar,
+}
+
+# Settings that _validate_config requires to be integers or booleans
+_INT_KEYS = frozenset({'font_size', 'autosave_interval', 'max_recent_files', 'tab_size', 'large_file_threshold'})
+_BOOL_KEYS = frozenset({
+    'autosave_enabled', 'backup_files', 'restore_session', 'confirm_exit',
+    'word_wrap', 'line_numbers', 'highlight_current_line', 'show_whitespace',
+    'auto_indent', 'smart_indent', 'syntax_highlighting', 'spell_check_enabled',
+    'status_bar', 'show_line_endings', 'enable_logging',
+})
+
+# Checkbutton labels for the boolean settings
+_CHECK_LABELS = {
+    'autosave_enabled': "Enable auto-save",
+    'backup_files': "Create backup files",
+    'restore_session': "Restore session on startup",
+    'confirm_exit': "Confirm before exit",
+    'word_wrap': "Word wrap",
+    'line_numbers': "Show line numbers",
+    'highlight_current_line': "Highlight current line",
+    'show_whitespace': "Show whitespace characters",
+    'auto_indent': "Auto-indent",
+    'smart_indent': "Smart indent",
+    'syntax_highlighting': "Enable syntax highlighting",
+    'spell_check_enabled': "Enable spell checking",
+    'status_bar': "Show status bar",
+    'show_line_endings': "Show line endings",
+    'enable_logging': "Enable logging",
+}
+
+# Choices offered by the settings comboboxes
+_ENCODINGS = ('utf-8', 'utf-16', 'ascii', 'latin-1', 'cp1252')
+_SPELL_LANGUAGES = ('English', 'Spanish', 'French', 'German', 'Italian', 'Portuguese')
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# Keys every custom theme file must define
+_THEME_REQUIRED_KEYS = frozenset({'name', 'text_widget', 'line_numbers', 'syntax'})
+
+# Lowercases ASCII and turns spaces into underscores for theme file names
+_THEME_NAME_TABLE = str.maketrans({**{chr(c): chr(c).lower() for c in range(128)}, ' ': '_'})
+
+# Parsed theme files keyed by (path, mtime_ns), oldest evicted first
+_THEME_JSON_CACHE = {}
+_THEME_JSON_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_font_families(root):
+    """Sorted font families of a Tk root, enumerated once per process"""
+    return tuple(sorted(font.families(root)))
+
+
+@functools.lru_cache(maxsize=1)
+def _theme_choices(themes):
+    """Sorted (display name, theme name) pairs, always including the built-in themes"""
+    return tuple((theme.title(), theme) for theme in sorted({'light', 'dark', *themes}))
+
+
+def _load_theme_json(path):
+    """Parse a theme file, reusing the previous result while it is unchanged"""
+    key = (str(path), os.stat(path).st_mtime_ns)
+    theme_data = _THEME_JSON_CACHE.get(key)
+    if theme_data is None:
+        theme_data = loads(Path(path).read_bytes())
+        if len(_THEME_JSON_CACHE) >= _THEME_JSON_CACHE_SIZE:
+            del _THEME_JSON_CACHE[next(iter(_THEME_JSON_CACHE))]
+        _THEME_JSON_CACHE[key] = theme_data
+    return theme_data
+
 
 class SettingsWindow:
     """Settings and preferences window"""
@@ -18,16 +131,24 @@ class SettingsWindow:
         # Validate config before proceeding
         self._validate_config()
 
-        # Store original settings for cancel functionality
-        self.original_settings = self.config.get_all().copy()
+        # Values last pushed to the editor, so unchanged ones skip Tk calls
+        self._last_applied = {}
+
+        # Pending font preview refresh and the font it last rendered
+        self.font_preview = None
+        self._preview_after = None
+        self._last_preview_font = None
+
+        # Current setting values; Tk variables are created only for built tabs
+        self._values = self.config.get_many(_SETTING_TYPES)
+        self._setting_vars = {}
 
         # Create settings window
         self.window = tk.Toplevel(editor.window)
         self.window.title("Settings")
-        self.window.geometry("600x500")
+        self.window.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.window.resizable(True, True)
         self.window.transient(editor.window)
-        self.window.grab_set()
 
         # Center the window
         self._center_window()
@@ -35,53 +156,48 @@ class SettingsWindow:
         # Create UI
         self._create_ui()
 
-        # Load current settings
-        self._load_settings()
-
         # Bind close event
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
 
+        # Make the window modal once its widgets exist
+        self.window.after_idle(self.window.grab_set)
+
     def _validate_config(self):
         """Validate configuration has proper types"""
-        # Ensure all integer settings have integer values
-        int_keys = ['font_size', 'autosave_interval', 'max_recent_files', 'tab_size', 'large_file_threshold']
-        for key in int_keys:
-            value = self.config.get(key)
-            if not isinstance(value, int) or value == "":
-                default_value = self.config.default_config.get(key, 12)
-                self.config.set(key, default_value)
-                print(f"Fixed config {key}: set to {default_value}")
-
-        # Ensure all boolean settings have boolean values
-        bool_keys = ['autosave_enabled', 'backup_files', 'restore_session', 'confirm_exit',
-                     'word_wrap', 'line_numbers', 'highlight_current_line', 'show_whitespace',
-                     'auto_indent', 'smart_indent', 'syntax_highlighting', 'spell_check_enabled',
-                     'status_bar', 'show_line_endings', 'enable_logging']
-        for key in bool_keys:
-            value = self.config.get(key)
-            if not isinstance(value, bool) or value == "":
-                default_value = self.config.default_config.get(key, True)
-                self.config.set(key, default_value)
-                print(f"Fixed config {key}: set to {default_value}")
+        fixes = {}
+        for key, value in self.config.get_all().items():
+            # Integer settings must hold integers, boolean settings booleans
+            if key in _INT_KEYS:
+                if not isinstance(value, int):
+                    fixes[key] = self.config.default_config.get(key, 12)
+            elif key in _BOOL_KEYS and not isinstance(value, bool):
+                fixes[key] = self.config.default_config.get(key, True)
+
+        if fixes:
+            self.config.update(fixes)
+            self.editor.app.logger.info(
+                "Fixed config " + ", ".join(f"{key}: set to {value}" for key, value in fixes.items())
+            )
 
     def _center_window(self):
         """Center the settings window on the parent window"""
-        self.window.update_idletasks()
-
         # Get parent window position and size
         parent_x = self.editor.window.winfo_x()
         parent_y = self.editor.window.winfo_y()
         parent_width = self.editor.window.winfo_width()
         parent_height = self.editor.window.winfo_height()
 
-        # Calculate center position
-        window_width = self.window.winfo_width()
-        window_height = self.window.winfo_height()
+        # Fall back to the screen if the parent has not been mapped yet
+        if parent_width <= 1 or parent_height <= 1:
+            parent_x = parent_y = 0
+            parent_width = self.window.winfo_screenwidth()
+            parent_height = self.window.winfo_screenheight()
 
-        x = parent_x + (parent_width - window_width) // 2
-        y = parent_y + (parent_height - window_height) // 2
+        # Calculate center position
+        x = parent_x + (parent_width - WINDOW_WIDTH) // 2
+        y = parent_y + (parent_height - WINDOW_HEIGHT) // 2
 
-        self.window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+        self.window.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
 
     def _create_ui(self):
         """Create the settings user interface"""
@@ -93,11 +209,23 @@ class SettingsWindow:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
 
-        # Create tabs
-        self._create_general_tab()
-        self._create_editor_tab()
-        self._create_appearance_tab()
-        self._create_advanced_tab()
+        # Create tabs; only General is built up front, the rest on first selection
+        tabs = (
+            ("General", self._create_general_tab),
+            ("Editor", self._create_editor_tab),
+            ("Appearance", self._create_appearance_tab),
+            ("Advanced", self._create_advanced_tab),
+        )
+        lazy = self.window.tk.call('tk', 'windowingsystem') != 'aqua'
+        self._pending_tabs = {}
+        for index, (title, builder) in enumerate(tabs):
+            tab_frame = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(tab_frame, text=title)
+            if index and lazy:
+                self._pending_tabs[str(tab_frame)] = builder
+            else:
+                builder(tab_frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Buttons frame
         buttons_frame = ttk.Frame(main_frame)
@@ -109,62 +237,68 @@ class SettingsWindow:
         ttk.Button(buttons_frame, text="Apply", command=self._apply_settings).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(buttons_frame, text="Reset to Defaults", command=self._reset_defaults).pack(side=tk.LEFT)
 
-    def _create_general_tab(self):
+        # Apply feedback shown in place of a modal dialog
+        self.status_label = ttk.Label(buttons_frame)
+        self.status_label.pack(side=tk.LEFT, padx=(10, 0))
+
+    def _var(self, key):
+        """Get the Tk variable for a setting, creating it on first use"""
+        var = self._setting_vars.get(key)
+        if var is None:
+            var = _SETTING_TYPES[key](value=self._values[key])
+            self._setting_vars[key] = var
+        return var
+
+    def _create_checks(self, parent, keys, pady=0):
+        """Create a checkbutton for each boolean setting in keys"""
+        for key in keys:
+            ttk.Checkbutton(
+                parent,
+                text=_CHECK_LABELS[key],
+                variable=self._var(key)
+            ).pack(anchor=tk.W, pady=pady)
+
+    def _on_tab_changed(self, event=None):
+        """Build a placeholder tab the first time it is selected"""
+        tab_id = str(self.notebook.select())
+        builder = self._pending_tabs.pop(tab_id, None)
+        if builder:
+            builder(self.notebook.nametowidget(tab_id))
+
+    def _create_general_tab(self, general_frame):
         """Create general settings tab"""
-        general_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(general_frame, text="General")
-
         # File handling
         file_group = ttk.LabelFrame(general_frame, text="File Handling", padding="10")
         file_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.auto_save_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            file_group,
-            text="Enable auto-save",
-            variable=self.auto_save_var
-        ).pack(anchor=tk.W)
+        self._create_checks(file_group, ('autosave_enabled',))
 
         # Auto-save interval
         interval_frame = ttk.Frame(file_group)
         interval_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(interval_frame, text="Auto-save interval (seconds):").pack(side=tk.LEFT)
-        self.auto_save_interval_var = tk.IntVar()
         interval_spinbox = ttk.Spinbox(
             interval_frame,
             from_=30,
             to=3600,
-            textvariable=self.auto_save_interval_var,
+            textvariable=self._var('autosave_interval'),
             width=10
         )
         interval_spinbox.pack(side=tk.RIGHT)
 
-        self.backup_files_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            file_group,
-            text="Create backup files",
-            variable=self.backup_files_var
-        ).pack(anchor=tk.W, pady=(5, 0))
-
-        self.restore_session_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            file_group,
-            text="Restore session on startup",
-            variable=self.restore_session_var
-        ).pack(anchor=tk.W, pady=(5, 0))
+        self._create_checks(file_group, ('backup_files', 'restore_session'), pady=(5, 0))
 
         # Recent files
         recent_frame = ttk.Frame(file_group)
         recent_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(recent_frame, text="Max recent files:").pack(side=tk.LEFT)
-        self.max_recent_var = tk.IntVar()
         recent_spinbox = ttk.Spinbox(
             recent_frame,
             from_=5,
             to=50,
-            textvariable=self.max_recent_var,
+            textvariable=self._var('max_recent_files'),
             width=10
         )
         recent_spinbox.pack(side=tk.RIGHT)
@@ -173,151 +307,90 @@ class SettingsWindow:
         behavior_group = ttk.LabelFrame(general_frame, text="Application Behavior", padding="10")
         behavior_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.confirm_exit_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            behavior_group,
-            text="Confirm before exit",
-            variable=self.confirm_exit_var
-        ).pack(anchor=tk.W)
+        self._create_checks(behavior_group, ('confirm_exit',))
 
         # Default encoding
         encoding_frame = ttk.Frame(behavior_group)
         encoding_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(encoding_frame, text="Default encoding:").pack(side=tk.LEFT)
-        self.encoding_var = tk.StringVar()
         encoding_combo = ttk.Combobox(
             encoding_frame,
-            textvariable=self.encoding_var,
-            values=['utf-8', 'utf-16', 'ascii', 'latin-1', 'cp1252'],
+            textvariable=self._var('encoding'),
+            values=_ENCODINGS,
             state='readonly',
             width=15
         )
         encoding_combo.pack(side=tk.RIGHT)
 
-    def _create_editor_tab(self):
+    def _create_editor_tab(self, editor_frame):
         """Create editor settings tab"""
-        editor_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(editor_frame, text="Editor")
-
         # Text editing
         text_group = ttk.LabelFrame(editor_frame, text="Text Editing", padding="10")
         text_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.word_wrap_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            text_group,
-            text="Word wrap",
-            variable=self.word_wrap_var
-        ).pack(anchor=tk.W)
-
-        self.line_numbers_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            text_group,
-            text="Show line numbers",
-            variable=self.line_numbers_var
-        ).pack(anchor=tk.W)
-
-        self.highlight_current_line_var = tk.BooleanVar()
-        ttk.Checkbutton(
+        self._create_checks(
             text_group,
-            text="Highlight current line",
-            variable=self.highlight_current_line_var
-        ).pack(anchor=tk.W)
-
-        self.show_whitespace_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            text_group,
-            text="Show whitespace characters",
-            variable=self.show_whitespace_var
-        ).pack(anchor=tk.W)
+            ('word_wrap', 'line_numbers', 'highlight_current_line', 'show_whitespace')
+        )
 
         # Tab settings
         tab_frame = ttk.Frame(text_group)
         tab_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(tab_frame, text="Tab size:").pack(side=tk.LEFT)
-        self.tab_size_var = tk.IntVar()
         tab_spinbox = ttk.Spinbox(
             tab_frame,
             from_=2,
             to=8,
-            textvariable=self.tab_size_var,
+            textvariable=self._var('tab_size'),
             width=5
         )
         tab_spinbox.pack(side=tk.RIGHT)
 
         # Auto-indent
-        self.auto_indent_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            text_group,
-            text="Auto-indent",
-            variable=self.auto_indent_var
-        ).pack(anchor=tk.W, pady=(5, 0))
-
-        self.smart_indent_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            text_group,
-            text="Smart indent",
-            variable=self.smart_indent_var
-        ).pack(anchor=tk.W)
+        self._create_checks(text_group, ('auto_indent', 'smart_indent'), pady=(5, 0))
 
         # Syntax highlighting
         syntax_group = ttk.LabelFrame(editor_frame, text="Syntax Highlighting", padding="10")
         syntax_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.syntax_highlighting_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            syntax_group,
-            text="Enable syntax highlighting",
-            variable=self.syntax_highlighting_var
-        ).pack(anchor=tk.W)
+        self._create_checks(syntax_group, ('syntax_highlighting',))
 
         # Spell checking
         spell_group = ttk.LabelFrame(editor_frame, text="Spell Checking", padding="10")
         spell_group.pack(fill=tk.X)
 
-        self.spell_check_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            spell_group,
-            text="Enable spell checking",
-            variable=self.spell_check_var
-        ).pack(anchor=tk.W)
+        self._create_checks(spell_group, ('spell_check_enabled',))
 
         # Spell check language
         lang_frame = ttk.Frame(spell_group)
         lang_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(lang_frame, text="Language:").pack(side=tk.LEFT)
-        self.spell_language_var = tk.StringVar()
         lang_combo = ttk.Combobox(
             lang_frame,
-            textvariable=self.spell_language_var,
-            values=['English', 'Spanish', 'French', 'German', 'Italian', 'Portuguese'],
+            textvariable=self._var('spell_language'),
+            values=_SPELL_LANGUAGES,
             state='readonly',
             width=15
         )
         lang_combo.pack(side=tk.RIGHT)
 
-    def _create_appearance_tab(self):
+    def _create_appearance_tab(self, appearance_frame):
         """Create appearance settings tab"""
-        appearance_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(appearance_frame, text="Appearance")
-
         # Theme selection
         theme_group = ttk.LabelFrame(appearance_frame, text="Theme", padding="10")
         theme_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.theme_var = tk.StringVar()
-
         # Get available themes
         available_themes = self._get_available_themes()
 
-        for theme in available_themes:
+        for display_name, theme in available_themes:
             ttk.Radiobutton(
                 theme_group,
-                text=theme.title(),
-                variable=self.theme_var,
+                text=display_name,
+                variable=self._var('theme'),
                 value=theme
             ).pack(anchor=tk.W)
 
@@ -346,13 +419,12 @@ class SettingsWindow:
         family_frame.pack(fill=tk.X, pady=(0, 5))
 
         ttk.Label(family_frame, text="Font family:").pack(side=tk.LEFT)
-        self.font_family_var = tk.StringVar()
 
         # Get available fonts
-        available_fonts = sorted(font.families())
+        available_fonts = _cached_font_families(self.window._root())
         font_combo = ttk.Combobox(
             family_frame,
-            textvariable=self.font_family_var,
+            textvariable=self._var('font_family'),
             values=available_fonts,
             width=20
         )
@@ -363,12 +435,11 @@ class SettingsWindow:
         size_frame.pack(fill=tk.X, pady=(0, 5))
 
         ttk.Label(size_frame, text="Font size:").pack(side=tk.LEFT)
-        self.font_size_var = tk.IntVar()
         size_spinbox = ttk.Spinbox(
             size_frame,
             from_=8,
             to=72,
-            textvariable=self.font_size_var,
+            textvariable=self._var('font_size'),
             width=5
         )
         size_spinbox.pack(side=tk.RIGHT)
@@ -388,30 +459,16 @@ class SettingsWindow:
         # Update preview when font changes
         font_combo.bind('<<ComboboxSelected>>', self._update_font_preview)
         size_spinbox.bind('<KeyRelease>', self._update_font_preview)
+        self._update_font_preview()
 
         # UI settings
         ui_group = ttk.LabelFrame(appearance_frame, text="User Interface", padding="10")
         ui_group.pack(fill=tk.X)
 
-        self.status_bar_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            ui_group,
-            text="Show status bar",
-            variable=self.status_bar_var
-        ).pack(anchor=tk.W)
-
-        self.show_line_endings_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            ui_group,
-            text="Show line endings",
-            variable=self.show_line_endings_var
-        ).pack(anchor=tk.W)
-
-    def _create_advanced_tab(self):
-        """Create advanced settings tab"""
-        advanced_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(advanced_frame, text="Advanced")
+        self._create_checks(ui_group, ('status_bar', 'show_line_endings'))
 
+    def _create_advanced_tab(self, advanced_frame):
+        """Create advanced settings tab"""
         # Performance
         perf_group = ttk.LabelFrame(advanced_frame, text="Performance", padding="10")
         perf_group.pack(fill=tk.X, pady=(0, 10))
@@ -421,12 +478,11 @@ class SettingsWindow:
         threshold_frame.pack(fill=tk.X, pady=(0, 5))
 
         ttk.Label(threshold_frame, text="Large file threshold (MB):").pack(side=tk.LEFT)
-        self.large_file_threshold_var = tk.IntVar()
         threshold_spinbox = ttk.Spinbox(
             threshold_frame,
             from_=1,
             to=100,
-            textvariable=self.large_file_threshold_var,
+            textvariable=self._var('large_file_threshold'),
             width=5
         )
         threshold_spinbox.pack(side=tk.RIGHT)
@@ -435,23 +491,17 @@ class SettingsWindow:
         log_group = ttk.LabelFrame(advanced_frame, text="Logging", padding="10")
         log_group.pack(fill=tk.X, pady=(0, 10))
 
-        self.enable_logging_var = tk.BooleanVar()
-        ttk.Checkbutton(
-            log_group,
-            text="Enable logging",
-            variable=self.enable_logging_var
-        ).pack(anchor=tk.W)
+        self._create_checks(log_group, ('enable_logging',))
 
         # Log level
         level_frame = ttk.Frame(log_group)
         level_frame.pack(fill=tk.X, pady=(5, 0))
 
         ttk.Label(level_frame, text="Log level:").pack(side=tk.LEFT)
-        self.log_level_var = tk.StringVar()
         level_combo = ttk.Combobox(
             level_frame,
-            textvariable=self.log_level_var,
-            values=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+            textvariable=self._var('log_level'),
+            values=_LOG_LEVELS,
             state='readonly',
             width=10
         )
@@ -483,164 +533,142 @@ class SettingsWindow:
         ).pack(side=tk.LEFT, padx=(5, 0))
 
     def _get_available_themes(self):
-        """Get list of available themes"""
-        themes = ['light', 'dark']
-
-        # Check for additional theme files
-        themes_dir = Path('themes')
-        if themes_dir.exists():
-            for theme_file in themes_dir.glob('*.json'):
-                theme_name = theme_file.stem
-                if theme_name not in themes:
-                    themes.append(theme_name)
-
-        return themes
+        """Get (display name, theme name) pairs for the available themes"""
+        # The config loader caches the directory listing and invalidates it
+        return _theme_choices(tuple(self.config.get_available_themes()))
 
     def _load_settings(self):
-        """Load current settings into the UI"""
-        # General settings
-        self.auto_save_var.set(self.config.get('autosave_enabled', True))
-        self.auto_save_interval_var.set(self.config.get('autosave_interval', 300))
-        self.backup_files_var.set(self.config.get('backup_files', True))
-        self.restore_session_var.set(self.config.get('restore_session', True))
-        self.max_recent_var.set(self.config.get('max_recent_files', 10))
-        self.confirm_exit_var.set(self.config.get('confirm_exit', True))
-        self.encoding_var.set(self.config.get('encoding', 'utf-8'))
-
-        # Editor settings
-        self.word_wrap_var.set(self.config.get('word_wrap', True))
-        self.line_numbers_var.set(self.config.get('line_numbers', True))
-        self.highlight_current_line_var.set(self.config.get('highlight_current_line', True))
-        self.show_whitespace_var.set(self.config.get('show_whitespace', False))
-        self.tab_size_var.set(self.config.get('tab_size', 4))
-        self.auto_indent_var.set(self.config.get('auto_indent', True))
-        self.smart_indent_var.set(self.config.get('smart_indent', True))
-        self.syntax_highlighting_var.set(self.config.get('syntax_highlighting', True))
-        self.spell_check_var.set(self.config.get('spell_check_enabled', True))
-        self.spell_language_var.set(self.config.get('spell_language', 'English'))
-
-        # Appearance settings
-        self.theme_var.set(self.config.get('theme', 'light'))
-        self.font_family_var.set(self.config.get('font_family', 'Consolas'))
-        self.font_size_var.set(self.config.get('font_size', 12))
-        self.status_bar_var.set(self.config.get('status_bar', True))
-        self.show_line_endings_var.set(self.config.get('show_line_endings', False))
-
-        # Advanced settings
-        self.large_file_threshold_var.set(self.config.get('large_file_threshold', 10))
-        self.enable_logging_var.set(self.config.get('enable_logging', True))
-        self.log_level_var.set(self.config.get('log_level', 'INFO'))
+        """Load current settings into the UI and return whether anything changed"""
+        values = self.config.get_many(_SETTING_TYPES)
+        changed = values != self._values
+        self._values = values
+
+        # Only touch variables whose value differs, each set is a Tcl round-trip
+        for key, var in self._setting_vars.items():
+            try:
+                current = var.get()
+            except tk.TclError:
+                current = None
+            if current != values[key]:
+                var.set(values[key])
+                changed = True
 
         # Update font preview
-        self._update_font_preview()
+        if changed:
+            self._update_font_preview()
+        return changed
 
     def _update_font_preview(self, event=None):
+        """Schedule a font preview update, coalescing rapid edits"""
+        if self._preview_after:
+            self.window.after_cancel(self._preview_after)
+        self._preview_after = self.window.after(PREVIEW_DELAY_MS, self._do_update_font_preview)
+
+    def _do_update_font_preview(self):
         """Update font preview"""
+        self._preview_after = None
+        if self.font_preview is None:
+            return
+
         try:
-            family = self.font_family_var.get()
-            size = self.font_size_var.get()
+            family = self._var('font_family').get()
+            size = self._var('font_size').get()
 
             if family and size:
                 font_tuple = (family, size)
+                if font_tuple == self._last_preview_font:
+                    return
                 self.font_preview.config(state='normal', font=font_tuple)
+                self._last_preview_font = font_tuple
                 self.font_preview.delete('1.0', 'end')
                 self.font_preview.insert('1.0',
                                          f"The quick brown fox jumps over the lazy dog.\n123456789\n{family} {size}pt")
                 self.font_preview.config(state='disabled')
-        except:
-            pass
+        except (tk.TclError, ValueError) as e:
+            # An empty or partly typed size leaves the preview as it was
+            self.editor.app.logger.debug(f"Font preview not updated: {e}")
 
     def _apply_settings(self):
         """Apply settings without closing window"""
-        # General settings
-        self.config.set('autosave_enabled', self.auto_save_var.get())
-        self.config.set('autosave_interval', self.auto_save_interval_var.get())
-        self.config.set('backup_files', self.backup_files_var.get())
-        self.config.set('restore_session', self.restore_session_var.get())
-        self.config.set('max_recent_files', self.max_recent_var.get())
-        self.config.set('confirm_exit', self.confirm_exit_var.get())
-        self.config.set('encoding', self.encoding_var.get())
-
-        # Editor settings
-        self.config.set('word_wrap', self.word_wrap_var.get())
-        self.config.set('line_numbers', self.line_numbers_var.get())
-        self.config.set('highlight_current_line', self.highlight_current_line_var.get())
-        self.config.set('show_whitespace', self.show_whitespace_var.get())
-        self.config.set('tab_size', self.tab_size_var.get())
-        self.config.set('auto_indent', self.auto_indent_var.get())
-        self.config.set('smart_indent', self.smart_indent_var.get())
-        self.config.set('syntax_highlighting', self.syntax_highlighting_var.get())
-        self.config.set('spell_check_enabled', self.spell_check_var.get())
-        self.config.set('spell_language', self.spell_language_var.get())
-
-        # Appearance settings
-        self.config.set('theme', self.theme_var.get())
-        self.config.set('font_family', self.font_family_var.get())
-        self.config.set('font_size', self.font_size_var.get())
-        self.config.set('status_bar', self.status_bar_var.get())
-        self.config.set('show_line_endings', self.show_line_endings_var.get())
-
-        # Advanced settings
-        self.config.set('large_file_threshold', self.large_file_threshold_var.get())
-        self.config.set('enable_logging', self.enable_logging_var.get())
-        self.config.set('log_level', self.log_level_var.get())
-
-        # Apply changes to editor
+        changed = self._store_settings()
+
+        # Apply changes to editor; menu toggles may have moved it away from the config
         self._apply_to_editor()
 
-        messagebox.showinfo("Settings", "Settings applied successfully!")
+        self.status_label.config(text="Settings applied successfully!" if changed else "No changes to apply")
+
+    def _store_settings(self):
+        """Save edited settings to the config and return the ones that changed"""
+        new_values = {key: var.get() for key, var in self._setting_vars.items()}
+        current = self.config.get_many(new_values)
+        changed = {key: value for key, value in new_values.items() if current[key] != value}
+        if changed:
+            self._values.update(changed)
+            self.config.update(changed)
+        return changed
 
     def _apply_to_editor(self):
         """Apply settings to the current editor"""
-        # Font changes
-        font_family = self.font_family_var.get()
-        font_size = self.font_size_var.get()
-
-        if font_family and font_size:
-            self.editor.font_family = font_family
-            self.editor.font_size = font_size
-            current_size = font_size + self.editor.zoom_level
-            self.editor.text_widget.config(font=(font_family, current_size))
-
-        # Theme changes
-        if self.theme_var.get() != self.editor.current_theme:
-            self.editor.current_theme = self.theme_var.get()
-            self.editor._apply_theme()
-
-        # Word wrap
-        wrap_mode = tk.WORD if self.word_wrap_var.get() else tk.NONE
-        self.editor.text_widget.config(wrap=wrap_mode)
-
-        # Line numbers
-        if self.line_numbers_var.get():
-            if not self.editor.line_numbers.winfo_viewable():
-                self.editor.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
-        else:
-            if self.editor.line_numbers.winfo_viewable():
-                self.editor.line_numbers.pack_forget()
-
-        # Status bar
-        if self.status_bar_var.get():
-            if not self.editor.status_bar.winfo_viewable():
-                self.editor.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
-        else:
-            if self.editor.status_bar.winfo_viewable():
-                self.editor.status_bar.pack_forget()
+        self._apply_to_editor_cheap()
+        self._apply_to_editor_heavy()
+
+    def _apply_to_editor_cheap(self):
+        """Apply the settings that do not re-layout the text widget"""
+        values = self._values
+
+        # Line numbers and status bar (the menu bar tracks their visibility)
+        self.editor.menu_bar.set_line_numbers_visible(values['line_numbers'])
+        self.editor.menu_bar.set_status_bar_visible(values['status_bar'])
 
         # Auto-save settings
         if hasattr(self.editor, 'autosave'):
-            self.editor.autosave.set_enabled(self.auto_save_var.get())
-            self.editor.autosave.set_interval(self.auto_save_interval_var.get())
+            self.editor.autosave.set_enabled(values['autosave_enabled'])
+            self.editor.autosave.set_interval(values['autosave_interval'])
+
+        # Spell check settings; building the checker is only worth it when enabling it
+        spell_check_enabled = values['spell_check_enabled']
+        if spell_check_enabled or self.editor.spell_checker_loaded:
+            spell_checker = self.editor.spell_checker
+            if spell_checker.enabled != spell_check_enabled:
+                spell_checker.toggle_spell_check()
+
+    def _apply_to_editor_heavy(self):
+        """Apply font, theme and wrap settings, which re-layout the text widget"""
+        values = self._values
 
-        # Spell check settings
-        if hasattr(self.editor, 'spell_checker'):
-            if not self.spell_check_var.get():
-                self.editor.spell_checker.toggle_spell_check()
+        try:
+            # Font changes
+            font_family = values['font_family']
+            font_size = values['font_size']
+
+            if font_family and font_size:
+                self.editor.font_family = font_family
+                self.editor.font_size = font_size
+                editor_font = (font_family, font_size + self.editor.zoom_level)
+                if editor_font != self._last_applied.get('font'):
+                    self.editor.text_widget.config(font=editor_font)
+                    self._last_applied['font'] = editor_font
+
+            # Theme changes
+            if values['theme'] != self.editor.current_theme:
+                self.editor.current_theme = values['theme']
+                self.editor._apply_theme()
+
+            # Word wrap
+            wrap_mode = tk.WORD if values['word_wrap'] else tk.NONE
+            if wrap_mode != self._last_applied.get('wrap'):
+                self.editor.text_widget.config(wrap=wrap_mode)
+                self._last_applied['wrap'] = wrap_mode
+        except tk.TclError:
+            # The editor may have been closed before a deferred apply ran
+            pass
 
     def _apply_and_close(self):
-        """Apply settings and close window"""
-        self._apply_settings()
+        """Apply settings and close window, deferring the text re-layout"""
+        self._store_settings()
+        self._apply_to_editor_cheap()
         self.window.destroy()
+        self.editor.window.after_idle(self._apply_to_editor_heavy)
 
     def _cancel(self):
         """Cancel changes and close window"""
@@ -655,8 +683,8 @@ class SettingsWindow:
 
         if result:
             self.config.reset_to_defaults()
-            self._load_settings()
-            messagebox.showinfo("Settings", "Settings reset to defaults!")
+            changed = self._load_settings()
+            self.status_label.config(text="Settings reset to defaults" if changed else "Already at defaults")
 
     def _on_close(self):
         """Handle window close event"""
@@ -672,23 +700,22 @@ class SettingsWindow:
 
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    theme_data = json.load(f)
+                theme_data = _load_theme_json(file_path)
 
                 # Validate theme structure
-                required_keys = ['name', 'text_widget', 'line_numbers', 'syntax']
-                if all(key in theme_data for key in required_keys):
+                if _THEME_REQUIRED_KEYS.issubset(theme_data):
                     # Copy theme to themes directory
-                    theme_name = theme_data.get('name', 'custom').lower().replace(' ', '_')
+                    theme_name = theme_data.get('name', 'custom').translate(_THEME_NAME_TABLE)
+                    if not theme_name.isascii():
+                        theme_name = theme_name.lower()
                     themes_dir = Path('themes')
                     themes_dir.mkdir(exist_ok=True)
 
                     new_theme_path = themes_dir / f"{theme_name}.json"
-                    with open(new_theme_path, 'w') as f:
-                        json.dump(theme_data, f, indent=2)
+                    new_theme_path.write_bytes(dumps(theme_data))
 
                     # Update theme selection
-                    self.theme_var.set(theme_name)
+                    self._var('theme').set(theme_name)
 
                     messagebox.showinfo("Theme Loaded", f"Theme '{theme_name}' loaded successfully!")
                 else:
@@ -707,16 +734,14 @@ class SettingsWindow:
 
         if file_path:
             try:
-                current_theme = self.theme_var.get()
+                current_theme = self._var('theme').get()
                 theme_path = Path('themes') / f"{current_theme}.json"
 
                 if theme_path.exists():
                     # Copy existing theme file
-                    with open(theme_path, 'r') as f:
-                        theme_data = json.load(f)
+                    theme_data = _load_theme_json(theme_path)
 
-                    with open(file_path, 'w') as f:
-                        json.dump(theme_data, f, indent=2)
+                    Path(file_path).write_bytes(dumps(theme_data))
 
                     messagebox.showinfo("Theme Exported", f"Theme exported to {file_path}")
                 else:
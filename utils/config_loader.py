@@ -2,9 +2,114 @@
 Configuration Loader - Handles application settings and session management
 """
 
+import atexit
+import functools
 import json
 import os
+import threading
+from collections import defaultdict
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
+
+from utils.json_io import dumps, loads
+
+# Records in recent.jsonl beyond which it is rewritten in compacted form
+RECENT_COMPACT_LINES = 200
+
+# Delay before changed settings are written, so bursts of set() calls share one save
+SAVE_DELAY_SECONDS = 0.5
+
+
+def _write_atomic(path, data):
+    """Write bytes through a synced temporary file renamed over path"""
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        # Clean up temporary file if something went wrong
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Default configuration - ENSURE ALL VALUES ARE PROPER TYPES
+_DEFAULT_CONFIG = MappingProxyType({
+    # String values
+    'theme': 'light',
+    'font_family': 'Consolas',
+    'encoding': 'utf-8',
+    'window_geometry': '1000x700',
+    'spell_language': 'English',
+    'log_level': 'INFO',
+
+    # Integer values - EXPLICITLY SET AS INTEGERS
+    'font_size': 12,
+    'autosave_interval': 300,  # 5 minutes
+    'tab_size': 4,
+    'max_recent_files': 10,
+    'large_file_threshold': 10,
+    'max_undo': 20,
+
+    # Boolean values - EXPLICITLY SET AS BOOLEANS
+    'word_wrap': True,
+    'line_numbers': True,
+    'status_bar': True,
+    'autosave_enabled': True,
+    'spell_check_enabled': True,
+    'syntax_highlighting': True,
+    'show_whitespace': False,
+    'highlight_current_line': True,
+    'auto_indent': True,
+    'smart_indent': True,
+    'show_line_endings': False,
+    'backup_files': True,
+    'confirm_exit': True,
+    'restore_session': True,
+    'enable_logging': True,
+
+    # List values
+    'recent_files': []
+})
+
+
+def _fresh_defaults():
+    """Mutable copy of the default configuration with its own recent files list"""
+    return {**_DEFAULT_CONFIG, 'recent_files': []}
+
+
+def _existing_paths(paths):
+    """Filter paths to those that exist, listing shared parent directories once"""
+    by_dir = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path)].append(path)
+
+    existing = set()
+    for directory, dir_paths in by_dir.items():
+        names = ()
+        if len(dir_paths) > 1:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                pass
+        # Names missing from the listing are still checked, e.g. on case-insensitive drives
+        existing.update(path for path in dir_paths
+                        if os.path.basename(path) in names or os.path.exists(path))
+
+    return [path for path in paths if path in existing]
+
+
+@functools.lru_cache(maxsize=1)
+def _list_themes(themes_mtime):
+    """Theme names in the themes directory for a given directory mtime"""
+    return tuple(theme_file.stem for theme_file in Path('themes').glob('*.json'))
 
 
 class ConfigLoader:
@@ -14,128 +119,254 @@ class ConfigLoader:
         self.config_dir = Path.home() / '.modern_notepad'
         self.config_file = self.config_dir / 'config.json'
         self.session_file = self.config_dir / 'session.json'
+        self.recent_file = self.config_dir / 'recent.jsonl'
 
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
 
-        # Default configuration - ENSURE ALL VALUES ARE PROPER TYPES
-        self.default_config = {
-            # String values
-            'theme': 'light',
-            'font_family': 'Consolas',
-            'encoding': 'utf-8',
-            'window_geometry': '1000x700',
-            'spell_language': 'English',
-            'log_level': 'INFO',
-
-            # Integer values - EXPLICITLY SET AS INTEGERS
-            'font_size': 12,
-            'autosave_interval': 300,  # 5 minutes
-            'tab_size': 4,
-            'max_recent_files': 10,
-            'large_file_threshold': 10,
-
-            # Boolean values - EXPLICITLY SET AS BOOLEANS
-            'word_wrap': True,
-            'line_numbers': True,
-            'status_bar': True,
-            'autosave_enabled': True,
-            'spell_check_enabled': True,
-            'syntax_highlighting': True,
-            'show_whitespace': False,
-            'highlight_current_line': True,
-            'auto_indent': True,
-            'smart_indent': True,
-            'show_line_endings': False,
-            'backup_files': True,
-            'confirm_exit': True,
-            'restore_session': True,
-            'enable_logging': True,
-
-            # List values
-            'recent_files': []
-        }
-
-        self.config = self._load_config()
+        # Default configuration, shared read-only by all instances
+        self.default_config = _DEFAULT_CONFIG
+
+        # Loaded on first access so startup does no file I/O until a setting is read
+        self._config = None
+
+        # Debounced saving; the lock guards config against the timer thread
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer = None
+        atexit.register(self.flush)
+
+        # Recent files as last written to recent.jsonl and its record count
+        self._recent_persisted = None
+        self._recent_lines = 0
+
+        # Bumped on every change so validate_config can skip an unchanged config
+        self._version = 0
+        self._validated_version = None
+
+        # Values returned by get(), keyed by (key, default) and cleared on every change
+        self._resolved = {}
+
+        # Accessors for settings read on hot paths, bypassing get()'s argument handling
+        self.get_theme = functools.partial(self.get, 'theme', 'light')
+        self.get_font_family = functools.partial(self.get, 'font_family', 'Consolas')
+        self.get_font_size = functools.partial(self.get, 'font_size', 12)
+
+    @property
+    def config(self):
+        """Configuration dictionary, loaded from disk on first use"""
+        if self._config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config = self._load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value):
+        """Replace the configuration dictionary"""
+        self._config = value
+        self._changed()
+
+    def _changed(self):
+        """Record a change to the configuration and drop the resolved values"""
+        self._version += 1
+        self._resolved.clear()
 
     def _load_config(self):
         """Load configuration from file"""
+        config = _fresh_defaults()
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-
+            # Unbuffered, so readall() fetches the whole file in one fstat-sized read
+            with open(self.config_file, 'rb', buffering=0) as f:
                 # Merge with defaults to ensure all keys exist
-                config = self.default_config.copy()
-                config.update(loaded_config)
-                return config
-            else:
-                return self.default_config.copy()
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+                config.update(loads(f.read()))
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError as e:
             print(f"Error loading config: {e}")
-            return self.default_config.copy()
 
-    def save_config(self):
-        """Save configuration to file"""
+        # Recent files are kept in recent.jsonl, which may exist without config.json
+        config['recent_files'] = self._load_recent(config)
+        return config
+
+    def _load_recent(self, config):
+        """Fold the recent files log into a newest-first list"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-            return True
+            with open(self.recent_file, 'rb', buffering=0) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            # Older versions kept the list in config.json; it is moved on the next save
+            return config['recent_files']
+
+        # Each line adds a path (a JSON string) or removes one ({"remove": path})
+        recent = {}
+        for line in lines:
+            try:
+                record = loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict):
+                recent.pop(record.get('remove'), None)
+            elif isinstance(record, str):
+                recent.pop(record, None)
+                recent[record] = None
+
+        # Loading runs before validate_config, so guard against a hand-edited limit
+        max_recent = config['max_recent_files']
+        if not isinstance(max_recent, int) or isinstance(max_recent, bool) or max_recent < 0:
+            max_recent = _DEFAULT_CONFIG['max_recent_files']
+
+        recent_files = list(islice(reversed(recent), max_recent))
+        self._recent_persisted = recent_files
+        self._recent_lines = len(lines)
+        return recent_files
+
+    def _write_recent(self, recent_files):
+        """Rewrite the recent files log with one line per file, newest last"""
+        try:
+            data = b''.join(dumps(path, indent=False) + b'\n' for path in reversed(recent_files))
+            _write_atomic(self.recent_file, data)
+            self._recent_persisted = list(recent_files)
+            self._recent_lines = len(recent_files)
         except Exception as e:
-            print(f"Error saving config: {e}")
-            return False
+            print(f"Error saving recent files: {e}")
 
-    def get(self, key, default=None):
-        """Get configuration value with validation"""
-        value = self.config.get(key, default)
+    def _append_recent(self, records):
+        """Append add/remove records to the recent files log"""
+        recent_files = self.config['recent_files']
+        if self._recent_persisted is None or self._recent_lines + len(records) > RECENT_COMPACT_LINES:
+            self._write_recent(recent_files)
+            return
+
+        try:
+            with open(self.recent_file, 'ab') as f:
+                f.write(b''.join(dumps(record, indent=False) + b'\n' for record in records))
+            self._recent_persisted = list(recent_files)
+            self._recent_lines += len(records)
+        except Exception as e:
+            print(f"Error saving recent files: {e}")
 
-        # If we get an empty string and default is not a string, return default
-        if value == "" and default is not None and not isinstance(default, str):
-            return default
+    def save_config(self):
+        """Save configuration to file"""
+        with self._lock:
+            self._dirty = False
+
+            # Recent files live in their own log; rewrite it only if set() or a reset changed them
+            recent_files = self.config.get('recent_files', [])
+            if recent_files != self._recent_persisted:
+                self._write_recent(recent_files)
+
+            try:
+                settings = {key: value for key, value in self.config.items() if key != 'recent_files'}
+                _write_atomic(self.config_file, dumps(settings))
+                return True
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return False
+
+    def _schedule_save(self):
+        """Mark the configuration dirty and save it once changes settle"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write pending configuration changes to disk"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            return self.save_config()
 
-        # If we get None and have a default, return default
-        if value is None and default is not None:
-            return default
+    def get(self, key, default=None):
+        """Get configuration value with validation"""
+        try:
+            return self._resolved[key, default]
+        except KeyError:
+            value = self._resolve(key, default)
+            self._resolved[key, default] = value
+            return value
+        except TypeError:
+            return self._resolve(key, default)  # Unhashable default, e.g. a list
+
+    def _resolve(self, key, default):
+        """Look up a configuration value, applying get()'s fallback rules"""
+        # Skip the lazy-load property once the config is in memory
+        value = (self._config or self.config).get(key, default)
+
+        # Only None and empty strings need the fallback checks
+        if value is None or value == "":
+            # If we get None and have a default, return default
+            # If we get an empty string and default is not a string, return default
+            if default is not None and (value is None or not isinstance(default, str)):
+                return default
 
         return value
 
     def set(self, key, value):
-        """Set configuration value and save"""
-        self.config[key] = value
-        self.save_config()
+        """Set configuration value and schedule a save"""
+        with self._lock:
+            self.config[key] = value
+            self._changed()
+        self._schedule_save()
+
+    def get_many(self, keys):
+        """Get several configuration values, falling back to their defaults"""
+        return {key: self.get(key, self.default_config.get(key)) for key in keys}
+
+    def update(self, values):
+        """Set several configuration values and schedule a single save"""
+        with self._lock:
+            self.config.update(values)
+            self._changed()
+        self._schedule_save()
 
     def get_all(self):
         """Get all configuration"""
-        return self.config.copy()
+        with self._lock:
+            return self.config.copy()
 
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
-        self.config = self.default_config.copy()
-        self.save_config()
+        with self._lock:
+            self.config = _fresh_defaults()
+            self.save_config()
 
     def add_recent_file(self, file_path):
         """Add file to recent files list"""
-        recent_files = self.config.get('recent_files', [])
-
-        # Remove if already exists
-        if file_path in recent_files:
-            recent_files.remove(file_path)
+        self.add_recent_files([file_path])
 
-        # Add to beginning
-        recent_files.insert(0, file_path)
+    def add_recent_files(self, file_paths):
+        """Add files to recent files list in opening order, appending them to the log"""
+        with self._lock:
+            # Newest first in one pass; dict keys keep order and drop duplicates
+            recent_files = dict.fromkeys([*reversed(file_paths), *self.config.get('recent_files', [])])
 
-        # Limit to max recent files
-        max_recent = self.config.get('max_recent_files', 10)
-        recent_files = recent_files[:max_recent]
-
-        self.set('recent_files', recent_files)
+            # Limit to max recent files
+            max_recent = self.config.get('max_recent_files', 10)
+            self.config['recent_files'] = list(islice(recent_files, max_recent))
+            self._changed()
+            self._append_recent(list(file_paths))
 
     def remove_recent_file(self, file_path):
         """Remove file from recent files list"""
-        recent_files = self.config.get('recent_files', [])
-        if file_path in recent_files:
-            recent_files.remove(file_path)
-            self.set('recent_files', recent_files)
+        self.remove_recent_files([file_path])
+
+    def remove_recent_files(self, file_paths):
+        """Remove files from recent files list, appending tombstones to the log"""
+        removed = set(file_paths)
+        with self._lock:
+            recent_files = self.config.get('recent_files', [])
+            if not removed.isdisjoint(recent_files):
+                self.config['recent_files'] = [f for f in recent_files if f not in removed]
+                self._changed()
+                self._append_recent([{'remove': path} for path in removed])
 
     def clear_recent_files(self):
         """Clear all recent files"""
@@ -144,8 +375,8 @@ class ConfigLoader:
     def save_session(self, session_data):
         """Save session data"""
         try:
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            # Sessions are only read back by the app, so skip the indentation
+            _write_atomic(self.session_file, dumps(session_data, indent=False))
             return True
         except Exception as e:
             print(f"Error saving session: {e}")
@@ -154,19 +385,18 @@ class ConfigLoader:
     def get_session(self):
         """Get session data"""
         try:
-            if self.session_file.exists():
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.session_file, 'rb', buffering=0) as f:
+                return loads(f.read())
+        except FileNotFoundError:
             return {}
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        except json.JSONDecodeError as e:
             print(f"Error loading session: {e}")
             return {}
 
     def clear_session(self):
         """Clear session data"""
         try:
-            if self.session_file.exists():
-                self.session_file.unlink()
+            self.session_file.unlink(missing_ok=True)
             return True
         except Exception as e:
             print(f"Error clearing session: {e}")
@@ -175,8 +405,9 @@ class ConfigLoader:
     def export_config(self, file_path):
         """Export configuration to file"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                data = dumps(self.config)
+            _write_atomic(file_path, data)
             return True
         except Exception as e:
             print(f"Error exporting config: {e}")
@@ -185,34 +416,37 @@ class ConfigLoader:
     def import_config(self, file_path):
         """Import configuration from file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_config = json.load(f)
+            with open(file_path, 'rb', buffering=0) as f:
+                imported_config = loads(f.read())
 
             # Validate and merge with current config
-            for key, value in imported_config.items():
-                if key in self.default_config:
-                    self.config[key] = value
+            with self._lock:
+                for key, value in imported_config.items():
+                    if key in self.default_config:
+                        self.config[key] = value
+                self._changed()
 
-            self.save_config()
+                self.save_config()
             return True
         except Exception as e:
             print(f"Error importing config: {e}")
             return False
 
-    def get_theme_path(self, theme_name):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def get_theme_path(theme_name):
         """Get path to theme file"""
         return Path('themes') / f'{theme_name}.json'
 
     def get_available_themes(self):
         """Get list of available themes"""
-        themes_dir = Path('themes')
-        if not themes_dir.exists():
+        try:
+            themes_mtime = os.stat('themes').st_mtime_ns
+        except OSError:
             return ['light', 'dark']
 
-        themes = []
-        for theme_file in themes_dir.glob('*.json'):
-            themes.append(theme_file.stem)
-
+        # Cached on the directory mtime, which changes when theme files are added
+        themes = list(_list_themes(themes_mtime))
         return themes if themes else ['light', 'dark']
 
     def create_default_themes(self):
@@ -290,33 +524,43 @@ class ConfigLoader:
             with open(dark_file, 'w', encoding='utf-8') as f:
                 json.dump(dark_theme, f, indent=2)
 
+        # A coarse directory mtime may not have moved; drop the cached listing
+        _list_themes.cache_clear()
+
     def validate_config(self):
         """Validate configuration and fix any issues"""
-        fixed = False
-
-        # Ensure all required keys exist
-        for key, default_value in self.default_config.items():
-            if key not in self.config:
-                self.config[key] = default_value
+        with self._lock:
+            # Nothing has changed since the last validation
+            if self._validated_version == self._version:
+                return False
+
+            fixed = False
+
+            # Ensure all required keys exist
+            for key, default_value in _fresh_defaults().items():
+                if key not in self.config:
+                    self.config[key] = default_value
+                    fixed = True
+
+            # Validate data types
+            if not isinstance(self.config.get('recent_files'), list):
+                self.config['recent_files'] = []
                 fixed = True
 
-        # Validate data types
-        if not isinstance(self.config.get('recent_files'), list):
-            self.config['recent_files'] = []
-            fixed = True
-
-        if not isinstance(self.config.get('font_size'), int):
-            self.config['font_size'] = 12
-            fixed = True
+            if not isinstance(self.config.get('font_size'), int):
+                self.config['font_size'] = 12
+                fixed = True
 
-        # Remove non-existent recent files
-        recent_files = self.config.get('recent_files', [])
-        valid_files = [f for f in recent_files if os.path.exists(f)]
-        if len(valid_files) != len(recent_files):
-            self.config['recent_files'] = valid_files
-            fixed = True
+            # Remove non-existent recent files
+            recent_files = self.config.get('recent_files', [])
+            valid_files = _existing_paths(recent_files)
+            if len(valid_files) != len(recent_files):
+                self.config['recent_files'] = valid_files
+                fixed = True
 
-        if fixed:
-            self.save_config()
+            if fixed:
+                self._changed()
+                self.save_config()
 
-        return fixed
+            self._validated_version = self._version
+            return fixed
@@ -0,0 +1,30 @@
+"""
+JSON I/O - orjson-backed JSON helpers with a standard library fallback
+"""
+
+import json
+
+# Try to import orjson, fall back to the json module
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=True):
+    """Serialize obj as UTF-8 JSON bytes, indented or compact"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -2,15 +2,49 @@
 Logger - Application logging utility
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
+import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
+# Formatters shared by the file and console handlers
+_DETAILED_FMT = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_SIMPLE_FMT = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Size at which a day's log file is rotated, and how many rotations are kept
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 7
+
+# Block size used when reading a log backwards for its last lines
+TAIL_BLOCK_SIZE = 8192
+
 
 class Logger:
     """Application logger"""
 
+    _instance = None
+
+    def __new__(cls, *args, **kwargs):
+        """Share one configured logger across all constructions"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self, log_level=logging.INFO):
+        # Handlers are only set up once; later constructions reuse them
+        if self._initialized:
+            return
+        self._initialized = True
+
         self.log_dir = Path.home() / '.modern_notepad' / 'logs'
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -26,25 +60,33 @@ class Logger:
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
 
-        # Create formatters
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
-        simple_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
+        # File handler, opened on the first record and rotated when it grows large
+        file_handler = logging.handlers.RotatingFileHandler(
+            self.log_file,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8',
+            delay=True
         )
-
-        # File handler
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        self.logger.addHandler(file_handler)
+        file_handler.setFormatter(_DETAILED_FMT)
 
         # Console handler (only for warnings and errors by default)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.WARNING)
-        console_handler.setFormatter(simple_formatter)
-        self.logger.addHandler(console_handler)
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setLevel(logging.WARNING)
+        self.console_handler.setFormatter(_SIMPLE_FMT)
+
+        # Callers only enqueue records; a background listener does the writing
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue,
+            file_handler,
+            self.console_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
         # Cleanup old log files (keep last 30 days)
         self._cleanup_old_logs()
@@ -54,58 +96,60 @@ class Logger:
         try:
             cutoff_date = datetime.now().timestamp() - (30 * 24 * 60 * 60)  # 30 days
 
-            for log_file in self.log_dir.glob('notepad_*.log'):
-                if log_file.stat().st_mtime < cutoff_date:
-                    log_file.unlink()
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if (entry.name.startswith('notepad_') and '.log' in entry.name
+                            and entry.stat().st_mtime < cutoff_date):
+                        os.unlink(entry.path)
         except Exception as e:
             self.logger.error(f"Error cleaning up old logs: {e}")
 
-    def debug(self, message):
+    def debug(self, message, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message):
+    def error(self, message, *args):
         """Log error message"""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Log critical message"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
-    def exception(self, message):
+    def exception(self, message, *args):
         """Log exception with traceback"""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
     def log_file_operation(self, operation, file_path, success=True):
         """Log file operation"""
         status = "SUCCESS" if success else "FAILED"
-        self.info(f"File operation: {operation} - {file_path} - {status}")
+        self.info("File operation: %s - %s - %s", operation, file_path, status)
 
     def log_user_action(self, action, details=None):
         """Log user action"""
-        message = f"User action: {action}"
         if details:
-            message += f" - {details}"
-        self.info(message)
+            self.info("User action: %s - %s", action, details)
+        else:
+            self.info("User action: %s", action)
 
     def log_performance(self, operation, duration):
         """Log performance metrics"""
-        self.info(f"Performance: {operation} took {duration:.3f} seconds")
+        self.info("Performance: %s took %.3f seconds", operation, duration)
 
     def log_error_with_context(self, error, context=None):
         """Log error with additional context"""
-        message = f"Error: {error}"
         if context:
-            message += f" | Context: {context}"
-        self.error(message)
+            self.error("Error: %s | Context: %s", error, context)
+        else:
+            self.error("Error: %s", error)
 
     def get_log_file_path(self):
         """Get current log file path"""
@@ -114,9 +158,20 @@ class Logger:
     def get_recent_logs(self, lines=100):
         """Get recent log entries"""
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                log_lines = f.readlines()
-                return log_lines[-lines:] if len(log_lines) > lines else log_lines
+            with open(self.log_file, 'rb') as f:
+                # Read whole blocks backwards from the end until enough lines are in hand
+                position = f.seek(0, os.SEEK_END)
+                data = b''
+                while position > 0 and data.count(b'\n') <= lines:
+                    step = min(TAIL_BLOCK_SIZE, position)
+                    position -= step
+                    f.seek(position)
+                    data = f.read(step) + data
+
+            # The first line may start mid-character, but it is dropped by the slice below
+            text = data.decode('utf-8', errors='replace')
+            log_lines = io.StringIO(text, newline=None).readlines()
+            return log_lines[-lines:] if len(log_lines) > lines else log_lines
         except Exception as e:
             self.error(f"Error reading log file: {e}")
             return []
@@ -145,10 +200,7 @@ class Logger:
 
     def set_console_log_level(self, level):
         """Set console logging level"""
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
-                handler.setLevel(level)
-                break
+        self.console_handler.setLevel(level)
 
     def enable_debug_mode(self):
         """Enable debug mode (show all logs in console)"""
@@ -173,22 +225,32 @@ def get_logger():
     return _logger_instance
 
 
-# Convenience functions
-def log_info(message):
-    get_logger().info(message)
+# Convenience functions; the level check skips the call when the level is filtered out
+def log_info(message, *args):
+    logger = get_logger().logger
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args)
 
 
-def log_error(message):
-    get_logger().error(message)
+def log_error(message, *args):
+    logger = get_logger().logger
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(message, *args)
 
 
-def log_warning(message):
-    get_logger().warning(message)
+def log_warning(message, *args):
+    logger = get_logger().logger
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, *args)
 
 
-def log_debug(message):
-    get_logger().debug(message)
+def log_debug(message, *args):
+    logger = get_logger().logger
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args)
 
 
-def log_exception(message):
-    get_logger().exception(message)
+def log_exception(message, *args):
+    logger = get_logger().logger
+    if logger.isEnabledFor(logging.ERROR):
+        logger.exception(message, *args)